@@ -32,6 +32,17 @@ a = Analysis(
         'ui',
         'ui.tabs',
         'ui.widgets',
+        # ui.widgets loads these lazily by name, so list them explicitly
+        'ui.widgets.monitoring_table',
+        'ui.widgets.engine_button',
+        'ui.widgets.status_bar',
+        'ui.widgets.telegram_config_widget',
+        'ui.widgets.grid_alerts_widget',
+        'ui.widgets.mtm_roi_alerts_widget',
+        'ui.widgets.margin_alerts_widget',
+        'ui.widgets.quantity_alerts_widget',
+        'ui.widgets.user_alias_model',
+        'ui.widgets.threshold_delegate',
         'utils',
     ],
     hookspath=[],
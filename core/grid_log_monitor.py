@@ -25,7 +25,7 @@ import os
 import re
 import logging
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Pattern
 
 
 class GridLogMonitor:
@@ -47,6 +47,10 @@ class GridLogMonitor:
         # Valid alert types
         self.valid_types = ['ATTENTION', 'ERROR', 'WARNING']
 
+        # Compiled filter regex, rebuilt only when the keywords change
+        self._filter_key = ()
+        self._filter_regex = None
+
     # ------------------------------------------------------------------
     # File management
     # ------------------------------------------------------------------
@@ -116,6 +120,7 @@ class GridLogMonitor:
         3 parts (no trailing fields), then peek ahead to grab line 3.
         """
         alerts = []
+        filter_regex = self._get_filter_regex(filter_keywords)
 
         try:
             if not self._open_log_file():
@@ -148,7 +153,7 @@ class GridLogMonitor:
                             suffix = ','.join(cont_parts[-3:])
                             combined = pending_partial.rstrip() + ',' + suffix
                             pending_partial = None
-                            alert = self._parse_log_line(combined, enabled_types, filter_keywords)
+                            alert = self._parse_log_line(combined, enabled_types, filter_regex)
                             if alert:
                                 alerts.append(alert)
                             continue
@@ -177,7 +182,7 @@ class GridLogMonitor:
                     pending_partial = stripped
                     continue
 
-                alert = self._parse_log_line(stripped, enabled_types, filter_keywords)
+                alert = self._parse_log_line(stripped, enabled_types, filter_regex)
                 if alert:
                     alerts.append(alert)
 
@@ -192,10 +197,26 @@ class GridLogMonitor:
     # Parsing
     # ------------------------------------------------------------------
 
+    def _get_filter_regex(self, filter_keywords: List[str]) -> Optional[Pattern]:
+        """
+        Get one case-insensitive regex matching any of the filter keywords.
+
+        A single regex search per line replaces a Python loop over the
+        keywords. The pattern is cached until the keyword list changes.
+        Returns None when there is nothing to filter.
+        """
+        key = tuple(kw.strip() for kw in filter_keywords or () if kw.strip())
+        if key != self._filter_key:
+            self._filter_key = key
+            self._filter_regex = (
+                re.compile('|'.join(map(re.escape, key)), re.IGNORECASE) if key else None
+            )
+        return self._filter_regex
+
     def _parse_log_line(self,
                         line: str,
                         enabled_types: List[str],
-                        filter_keywords: List[str]
+                        filter_regex: Optional[Pattern]
                         ) -> Optional[Tuple[str, str, str, str, str, str]]:
         """
         Parse one CSV line.
@@ -238,12 +259,11 @@ class GridLogMonitor:
                 return None
 
             # Skip if any filter keyword appears anywhere in the line
-            if filter_keywords:
-                line_lower = line.lower()
-                for keyword in filter_keywords:
-                    if keyword.strip().lower() in line_lower:
-                        self.logger.debug("Filtered alert containing: %s", keyword)
-                        return None
+            if filter_regex is not None:
+                match = filter_regex.search(line)
+                if match:
+                    self.logger.debug("Filtered alert containing: %s", match.group(0))
+                    return None
 
             return (alert_type, timestamp, message, user_id, strategy_tag, portfolio_name)
 
@@ -35,6 +35,21 @@ from typing import Optional
 import aiohttp
 
 
+def _get_session(session: Optional[aiohttp.ClientSession]) -> aiohttp.ClientSession:
+    """
+    Return session, or a new keep-alive session if it is missing or closed.
+
+    Must be called from inside the event loop that will own the session;
+    reusing it keeps the TLS connection to api.telegram.org open between
+    requests instead of a fresh handshake per call.
+    """
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60)
+        )
+    return session
+
+
 # ---------------------------------------------------------------------------
 # Burst buffer
 # ---------------------------------------------------------------------------
@@ -294,6 +309,7 @@ class SenderThread(threading.Thread):
         self._stop_event = threading.Event()
         self._sent_ts    = deque()
         self._loop       = None
+        self._session    = None   # reused for every send (keep-alive pool)
 
     def enqueue(self, message: str):
         self._queue.put(message)
@@ -314,6 +330,8 @@ class SenderThread(threading.Thread):
             # Final drain
             self._drain_once()
         finally:
+            if self._session is not None and not self._session.closed:
+                self._loop.run_until_complete(self._session.close())
             self._loop.close()
             self.logger.debug("Telegram sender thread stopped")
 
@@ -379,16 +397,17 @@ class SenderThread(threading.Thread):
         url     = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
         payload = {"chat_id": self.channel_id, "text": text, "parse_mode": "HTML"}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url, json=payload,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status == 200:
-                        return True
-                    error = await resp.text()
-                    self.logger.error("Telegram API %d: %s", resp.status, error[:200])
-                    return False
+            session = _get_session(self._session)
+            self._session = session
+            async with session.post(
+                url, json=payload,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as resp:
+                if resp.status == 200:
+                    return True
+                error = await resp.text()
+                self.logger.error("Telegram API %d: %s", resp.status, error[:200])
+                return False
         except asyncio.TimeoutError:
             self.logger.error("Telegram request timed out")
             return False
@@ -422,23 +441,43 @@ class TelegramClientSync:
 
     Internally: BurstBuffer (4s dedup window) -> SenderThread (background drain).
     send_message() is now fully non-blocking (fire-and-forget).
+    The sender thread starts with the first queued message, so a client
+    only used for verification never runs one.
     """
 
+    # getMe retries transient failures (network errors, 429, 5xx) before
+    # reporting the credentials as failed; the wait doubles per retry
+    GET_ME_RETRIES = 2
+    GET_ME_BACKOFF = 0.3  # seconds before the first retry
+
     def __init__(self, bot_token: str, channel_id: str):
         self.bot_token      = bot_token
         self.channel_id     = channel_id
         self.logger         = logging.getLogger(__name__)
         self._bot_username  = None
 
+        # One-off calls (getMe) share one loop + session per client
+        self._call_lock     = threading.Lock()
+        self._call_loop     = None
+        self._call_session  = None
+
         self._sender = SenderThread(bot_token, channel_id)
-        self._sender.start()
+        self._sender_lock = threading.Lock()
 
         self._buffer = BurstBuffer()
         self._buffer.set_flush_callback(self._on_buffer_flush)
 
+    def _enqueue(self, message: str):
+        """Queue a message for the sender thread, starting it on first use."""
+        if self._sender.ident is None:
+            with self._sender_lock:
+                if self._sender.ident is None:
+                    self._sender.start()
+        self._sender.enqueue(message)
+
     def _on_buffer_flush(self, messages: list):
         for msg in messages:
-            self._sender.enqueue(msg)
+            self._enqueue(msg)
 
     def send_message(self, text: str) -> bool:
         """Non-blocking. Message goes through burst buffer (4s dedup window)."""
@@ -452,7 +491,7 @@ class TelegramClientSync:
         where immediate delivery matters more than deduplication.
         Delivers in ~200ms instead of 4s.
         """
-        self._sender.enqueue(text)
+        self._enqueue(text)
         return True
 
     def verify_connection(self) -> tuple:
@@ -466,13 +505,17 @@ class TelegramClientSync:
             ts       = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             test_msg = f"Test Alert from Stoxxo Monitor\n\nConnection Successful\nTime: {ts}"
             # Bypass buffer for test message so it sends immediately
-            self._sender.enqueue(test_msg)
+            self._enqueue(test_msg)
         return ok, username
 
     async def _async_get_me(self) -> tuple:
         url = f"https://api.telegram.org/bot{self.bot_token}/getMe"
-        try:
-            async with aiohttp.ClientSession() as session:
+        for attempt in range(self.GET_ME_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(self.GET_ME_BACKOFF * 2 ** (attempt - 1))
+            try:
+                session = _get_session(self._call_session)
+                self._call_session = session
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
                     if resp.status == 200:
                         data = await resp.json()
@@ -480,21 +523,28 @@ class TelegramClientSync:
                             username = data['result'].get('username', 'Unknown')
                             self._bot_username = username
                             return True, username
-            return False, None
-        except Exception as e:
-            self.logger.error("getMe failed: %s", e)
-            return False, None
+                        return False, None
+                    if resp.status != 429 and resp.status < 500:
+                        # Rejected credentials - retrying will not help
+                        return False, None
+                    error = f"HTTP {resp.status}"
+            except Exception as e:
+                error = e
+            if attempt < self.GET_ME_RETRIES:
+                self.logger.warning("getMe failed (%s), retrying", error)
+        self.logger.error("getMe failed: %s", error)
+        return False, None
 
     def _run_once(self, coro):
-        """Run a one-off coroutine in a temporary event loop."""
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(coro)
-        except Exception as e:
-            self.logger.error("Async run failed: %s", e)
-            return False, None
-        finally:
-            loop.close()
+        """Run a one-off coroutine on this client's private event loop."""
+        with self._call_lock:
+            if self._call_loop is None or self._call_loop.is_closed():
+                self._call_loop = asyncio.new_event_loop()
+            try:
+                return self._call_loop.run_until_complete(coro)
+            except Exception as e:
+                self.logger.error("Async run failed: %s", e)
+                return False, None
 
     def get_rate_limit_status(self) -> dict:
         return self._sender.get_status()
@@ -504,9 +554,57 @@ class TelegramClientSync:
 
     def close(self):
         self._buffer.cancel()
-        self._sender.stop()
-        self._sender.join(timeout=5)
+        with self._sender_lock:
+            self._sender.stop()
+            started = self._sender.ident is not None
+        if started:
+            self._sender.join(timeout=5)
+        with self._call_lock:
+            if self._call_loop is not None and not self._call_loop.is_closed():
+                if self._call_session is not None and not self._call_session.closed:
+                    self._call_loop.run_until_complete(self._call_session.close())
+                self._call_loop.close()
+            self._call_session = None
 
 
 # Keep old name alive in case anything imports TelegramClient directly
-TelegramClient = TelegramClientSync
\ No newline at end of file
+TelegramClient = TelegramClientSync
+
+# ---------------------------------------------------------------------------
+# Shared client for credential checks (verify / test buttons) and alerts
+# ---------------------------------------------------------------------------
+
+_shared_lock   = threading.Lock()
+_shared_client: Optional[TelegramClientSync] = None
+
+
+def get_shared_client(bot_token: str, channel_id: str) -> TelegramClientSync:
+    """
+    Return one long-lived client for these credentials.
+
+    Verify, test and alert dispatch reuse its sessions and sender thread
+    instead of opening new connections each time; the previous client is
+    closed when the credentials change.
+    """
+    global _shared_client
+    with _shared_lock:
+        client = _shared_client
+        if client is None or (client.bot_token, client.channel_id) != (bot_token, channel_id):
+            if client is not None:
+                client.close()
+            client = _shared_client = TelegramClientSync(bot_token, channel_id)
+        return client
+
+
+def close_shared_client():
+    """
+    Close the shared client, if one was created (call once at exit).
+
+    Stops its sender thread and closes its aiohttp session so the
+    interpreter does not warn about an unclosed client session.
+    """
+    global _shared_client
+    with _shared_lock:
+        client, _shared_client = _shared_client, None
+    if client is not None:
+        client.close()
@@ -5,6 +5,7 @@ Main application entry point
 import sys
 import os
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QFile, QIODevice, QTextStream
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -55,10 +56,17 @@ def main():
             # Fallback to root styles folder
             stylesheet_path = resource_path(os.path.join('styles', 'dark_theme.qss'))
 
-        with open(stylesheet_path, 'r') as f:
-            stylesheet = f.read()
-            app.setStyleSheet(stylesheet)
+        # Read through QFile so the QSS goes straight into a QString
+        # instead of round-tripping through a Python str first
+        qss_file = QFile(stylesheet_path)
+        if qss_file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+            try:
+                app.setStyleSheet(QTextStream(qss_file).readAll())
+            finally:
+                qss_file.close()
             logger.info("Dark theme loaded successfully from: %s", stylesheet_path)
+        else:
+            logger.error("Failed to load stylesheet: %s", qss_file.errorString())
     except Exception as e:
         logger.error("Failed to load stylesheet: %s", str(e))
 
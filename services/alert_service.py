@@ -8,7 +8,7 @@ import time
 from typing import Optional, List
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from core.telegram_client import TelegramClientSync
+from core.telegram_client import TelegramClientSync, get_shared_client
 from core.grid_log_monitor import GridLogMonitor
 from services.alert_checker import AlertChecker
 from models.position_summary import OptionsPositionSummary
@@ -93,14 +93,13 @@ class AlertService(QThread):
         self.sound_enabled = telegram_config.get('sound_enabled', True)
         self.telegram_enabled = bool(self.bot_token and self.channel_id)
         
-        # If the service is running and credentials changed, reinitialize telegram client
+        # If the service is running and credentials changed, switch to the shared
+        # client for the new credentials (get_shared_client closes the old one)
         if self.is_running and credentials_changed:
-            if self.telegram_client:
-                self.telegram_client.close()
-                self.telegram_client = None
+            self.telegram_client = None
             if self.telegram_enabled:
                 try:
-                    self.telegram_client = TelegramClientSync(self.bot_token, self.channel_id)
+                    self.telegram_client = get_shared_client(self.bot_token, self.channel_id)
                     self.logger.info("Telegram client re-initialized with new credentials")
                 except Exception as e:
                     self.logger.error(f"Failed to re-initialize Telegram client: {e}")
@@ -200,7 +199,7 @@ class AlertService(QThread):
         try:
             # Telegram client
             if self.telegram_enabled:
-                self.telegram_client = TelegramClientSync(self.bot_token, self.channel_id)
+                self.telegram_client = get_shared_client(self.bot_token, self.channel_id)
                 self.logger.info("Telegram client initialized")
             
             # Grid log monitor
@@ -223,25 +222,38 @@ class AlertService(QThread):
         if self.grid_log_monitor:
             self.grid_log_monitor.close()
         
-        if self.telegram_client:
-            self.telegram_client.close()
+        # The shared Telegram client outlives the service (verify/test use
+        # it too); MainWindow closes it on exit
+        self.telegram_client = None
         
         self.status_changed.emit("Alert service stopped")
     
+    def _ensure_telegram_client(self) -> bool:
+        """
+        Point telegram_client at the shared client for the current credentials
+        
+        Fetched on every check, so a shared client that was replaced after a
+        credentials change (e.g. by a verify with new values) is never used.
+        
+        Returns:
+            True if a client is available
+        """
+        if not self.telegram_enabled:
+            self.telegram_client = None
+            return False
+        try:
+            self.telegram_client = get_shared_client(self.bot_token, self.channel_id)
+        except Exception as e:
+            self.logger.error(f"Failed to initialize Telegram client: {e}")
+            return False
+        return True
+    
     def _check_grid_log_alerts(self):
         """Check for grid log errors and send alerts"""
         
         # Guard: telegram client must exist
-        if not self.telegram_client:
-            if self.telegram_enabled:
-                try:
-                    self.telegram_client = TelegramClientSync(self.bot_token, self.channel_id)
-                    self.logger.debug("Telegram client initialized (lazy)")
-                except Exception as e:
-                    self.logger.error(f"Failed to initialize Telegram client: {e}")
-                    return
-            else:
-                return
+        if not self._ensure_telegram_client():
+            return
         
         # Initialize grid log monitor lazily if not yet created
         if not self.grid_log_monitor:
@@ -312,16 +324,8 @@ class AlertService(QThread):
             return
         
         # Guard: telegram client must exist
-        if not self.telegram_client:
-            if self.telegram_enabled:
-                try:
-                    self.telegram_client = TelegramClientSync(self.bot_token, self.channel_id)
-                    self.logger.debug("Telegram client initialized (lazy)")
-                except Exception as e:
-                    self.logger.error(f"Failed to initialize Telegram client: {e}")
-                    return
-            else:
-                return
+        if not self._ensure_telegram_client():
+            return
         
         try:
             # Check all alerts
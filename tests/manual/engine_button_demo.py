@@ -0,0 +1,59 @@
+"""
+ENGINE Button Demo
+Manual check of the EngineButton start/stop states and styling
+
+Usage: python tests/manual/engine_button_demo.py
+"""
+import sys
+import os
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel
+from PyQt6.QtCore import Qt
+
+from ui.widgets.engine_button import EngineButton
+
+app = QApplication(sys.argv)
+
+# Load stylesheet
+try:
+    with open(os.path.join(ROOT, 'ui', 'styles', 'dark_theme.qss'), 'r') as f:
+        app.setStyleSheet(f.read())
+except:
+    print("Could not load stylesheet")
+
+# Create window
+window = QMainWindow()
+window.setWindowTitle("ENGINE Button Test")
+window.setGeometry(100, 100, 400, 300)
+
+# Central widget
+central = QWidget()
+layout = QVBoxLayout(central)
+
+# Status label
+status_label = QLabel("Status: Stopped")
+status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+layout.addWidget(status_label)
+
+# ENGINE button
+engine_btn = EngineButton()
+layout.addWidget(engine_btn)
+
+# Connect signals
+def on_started():
+    status_label.setText("Status: RUNNING")
+    print("Engine started!")
+
+def on_stopped():
+    status_label.setText("Status: STOPPED")
+    print("Engine stopped!")
+
+engine_btn.engine_started.connect(on_started)
+engine_btn.engine_stopped.connect(on_stopped)
+
+window.setCentralWidget(central)
+window.show()
+
+sys.exit(app.exec())
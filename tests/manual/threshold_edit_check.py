@@ -0,0 +1,81 @@
+"""
+Threshold Edit Check
+Verify that a threshold still being typed survives a user list change
+
+Usage: python tests/manual/threshold_edit_check.py
+"""
+import sys
+import os
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from PyQt6.QtWidgets import QApplication, QLineEdit
+
+from ui.widgets.margin_alerts_widget import MarginAlertsWidget
+from ui.widgets.mtm_roi_alerts_widget import MTMROIAlertsWidget
+from ui.widgets.quantity_alerts_widget import QuantityAlertsWidget
+
+app = QApplication(sys.argv)
+failures = 0
+
+
+def check(name, actual, expected):
+    """Print one result line and count failures"""
+    global failures
+    if actual == expected:
+        print("   [OK] %s" % name)
+    else:
+        failures += 1
+        print("   [FAIL] %s: expected %r, got %r" % (name, expected, actual))
+
+
+def edit_then_change_users(widget, col, stored, typed):
+    """
+    Type into (a, col) without committing, change the user list, then commit
+    
+    Returns:
+        Thresholds for user "a" after the edit is committed
+    """
+    widget.show()
+    widget.update_users(["a"])
+    widget.model.set_value(0, col, stored)
+    app.processEvents()
+    
+    # Open the editor on user "a" and type without committing
+    widget.table.setCurrentIndex(widget.model.index(0, col))
+    app.processEvents()
+    editor = widget.table.findChild(QLineEdit)
+    editor.setText(typed)
+    
+    # New users arrive above and below "a" while the editor is open
+    widget.update_users(["z", "a", "b", "c"])
+    app.processEvents()
+    check("editor still open", widget.table.findChild(QLineEdit) is editor, True)
+    check("typed text kept", editor.text(), typed)
+    
+    widget.commit_edits()
+    return widget.get_all_thresholds()["a"]
+
+
+print("Testing threshold edits across user list changes")
+print("=" * 60)
+
+print("\n1. Margin alerts:")
+margin = MarginAlertsWidget()
+check("committed value", edit_then_change_users(margin, 1, "50.0", "75"), "75")
+
+print("\n2. MTM & ROI alerts:")
+mtm_roi = MTMROIAlertsWidget()
+thresholds = edit_then_change_users(mtm_roi, 3, "10", "12.5")
+check("committed ROI% above", thresholds["roi_above"], "12.5")
+
+print("\n3. Quantity alerts:")
+quantity = QuantityAlertsWidget()
+thresholds = edit_then_change_users(quantity, 5, "100", "250")
+check("committed calls net", thresholds["calls_net"], "250")
+
+print()
+if failures:
+    print("[FAIL] %d check(s) failed" % failures)
+    sys.exit(1)
+print("[OK] All checks passed")
@@ -3,7 +3,7 @@ Main Application Window
 """
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                               QLabel, QComboBox, QPushButton, QMessageBox, QTabWidget, QFrame)
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QEvent
 from PyQt6.QtGui import QFont
 from datetime import datetime
 import logging
@@ -18,6 +18,17 @@ from core.stoxxo_client import StoxxoClient
 from utils.settings_manager import SettingsManager
 from ui.tabs import MonitoringTab, AlertsTab
 from services.alert_service import AlertService
+from core.telegram_client import close_shared_client
+
+
+# Table row height for each selectable font size (font size is clamped to 8-20)
+_ROW_HEIGHT = {size: int(size * 3.5) for size in range(8, 21)}
+
+# Longest the UI thread will block waiting for the poller to exit (ms)
+_POLLER_STOP_TIMEOUT_MS = 2000
+
+# The poll interval is stretched by this factor while the window is minimized
+_MINIMIZED_POLL_FACTOR = 10
 
 
 class MainWindow(QMainWindow):
@@ -46,9 +57,16 @@ class MainWindow(QMainWindow):
         # Current data storage (for P&L toggle)
         self._current_summaries = []
         self._last_user_aliases = []  # Track user list to avoid redundant config updates
-        
+        self._last_update_time = None
+        self._last_update_str = None  # HH:MM:SS currently shown in the labels
+
+        # True while the window is minimized - table/ticker repaints are skipped
+        self._ui_suspended = False
+
         # Current font size (will be loaded from settings)
         self.current_font_size = self.settings_manager.get_font_size()
+        self._font_cache = {}  # {size: (table_font, header_font)}
+        self._connection_error_box = None  # Reused non-modal error dialog
         
         # Setup UI
         self._init_ui()
@@ -305,9 +323,10 @@ class MainWindow(QMainWindow):
         # Restore window geometry
         self.settings_manager.restore_window_geometry(self)
         
-        # Restore font size (just load the value, apply later)
+        # Restore font size (just load the value, apply later); clamp to
+        # the 8-20 range the +/- buttons allow
         saved_font_size = self.settings_manager.get_font_size()
-        self.current_font_size = saved_font_size
+        self.current_font_size = min(max(saved_font_size, 8), 20)
         
         # Restore polling interval
         saved_interval = self.settings_manager.get_polling_interval()
@@ -363,10 +382,14 @@ class MainWindow(QMainWindow):
         if self.poller:
             # Set interval
             interval = self.interval_combo.currentData()
-            self.poller.set_interval(interval)
+            self.poller.set_interval(self._poll_interval(interval))
             
-            # Start polling
-            self.poller.start()
+            # Start polling - a thread still finishing its last wait just
+            # gets woken so it polls right away with the new interval
+            if self.poller.isRunning():
+                self.poller.wake()
+            else:
+                self.poller.start()
             
             # Update status bar
             self.status_bar.set_refresh_status(True, interval)
@@ -396,8 +419,7 @@ class MainWindow(QMainWindow):
         self.logger.info("Stopping polling service...")
         
         if self.poller and self.poller.isRunning():
-            self.poller.stop()
-            self.poller.wait()  # Wait for thread to finish
+            self._stop_poller()
             
             # Update status bar
             self.status_bar.set_refresh_status(False)
@@ -410,6 +432,16 @@ class MainWindow(QMainWindow):
             self.alert_service.wait()  # Wait for thread to finish
             self.logger.info("Alert service stopped")
     
+    def _stop_poller(self):
+        """Stop the polling thread, waiting at most _POLLER_STOP_TIMEOUT_MS"""
+        self.poller.stop()  # Also wakes the thread out of its interval wait
+        if not self.poller.wait(_POLLER_STOP_TIMEOUT_MS):
+            self.logger.warning(
+                f"Poller did not exit in {_POLLER_STOP_TIMEOUT_MS / 1000:.0f}s, terminating"
+            )
+            self.poller.terminate()
+            self.poller.wait()
+    
     def _on_data_updated(self, summaries):
         """
         Handle data update from polling service
@@ -419,13 +451,13 @@ class MainWindow(QMainWindow):
         """
         # Store summaries for P&L toggle
         self._current_summaries = summaries
+        self._last_update_time = datetime.now()
 
-        # Update monitoring table
-        self.table.update_data(summaries)
+        # Skip all repaint work while minimized - the latest data is
+        # rendered once in _resume_ui() when the window is restored
+        if not self._ui_suspended:
+            self._render_summaries(summaries)
 
-        # Update ticker (exclude simulated/test users by user_id)
-        self._update_ticker(summaries)
-        
         # Update alerts tab with current user list
         user_aliases = [summary.user_alias for summary in summaries]
         
@@ -442,14 +474,73 @@ class MainWindow(QMainWindow):
 
             # Always pass fresh position data
             self.alert_service.update_position_data(summaries)
-        
-        # Update status bar
-        now = datetime.now()
-        self.status_bar.set_last_update(now)
-        self.last_update_label.setText("Last Update: %s" % now.strftime("%H:%M:%S"))
-        
-        self.logger.debug("Data updated: %d users", len(summaries))
-    
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Data updated: %d users", len(summaries))
+
+    def _render_summaries(self, summaries):
+        """
+        Push summaries to the visible widgets (table, ticker, timestamps)
+
+        Args:
+            summaries: List of OptionsPositionSummary objects
+        """
+        # Update monitoring table
+        self.table.update_data(summaries)
+
+        # Update ticker (exclude simulated/test users by user_id)
+        self._update_ticker(summaries)
+
+        # Update status bar - labels only show seconds, so skip the
+        # setText calls when a sub-second poll lands on the same second
+        now = self._last_update_time
+        if now is not None:
+            time_str = now.strftime("%H:%M:%S")
+            if time_str != self._last_update_str:
+                self._last_update_str = time_str
+                self.status_bar.set_last_update(now)
+                self.last_update_label.setText(f"Last Update: {time_str}")
+
+    def changeEvent(self, event):
+        """Suspend UI rendering while minimized, catch up on restore"""
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                if not self._ui_suspended:
+                    self._ui_suspended = True
+                    self._apply_poll_interval()
+                    self.logger.debug("Window minimized - UI updates suspended")
+            elif self._ui_suspended:
+                self._resume_ui()
+        super().changeEvent(event)
+
+    def _poll_interval(self, interval):
+        """
+        Get the poll interval to run with for the selected interval
+
+        Args:
+            interval: Interval selected in the combo box (seconds)
+
+        Returns:
+            The interval, stretched by _MINIMIZED_POLL_FACTOR while minimized
+        """
+        if self._ui_suspended:
+            return interval * _MINIMIZED_POLL_FACTOR
+        return interval
+
+    def _apply_poll_interval(self):
+        """Push the current poll interval to a running poller and wake it"""
+        if self.poller and self.poller.isRunning():
+            self.poller.set_interval(self._poll_interval(self.interval_combo.currentData()))
+            self.poller.wake()
+
+    def _resume_ui(self):
+        """Render the latest polled data after the window is restored"""
+        self._ui_suspended = False
+        self._apply_poll_interval()
+        self.logger.debug("Window restored - UI updates resumed")
+        if self._current_summaries:
+            self._render_summaries(self._current_summaries)
+
     def _update_ticker(self, summaries):
         """
         Update the Total P&L / Total ROI ticker in the tab strip corner.
@@ -500,7 +591,6 @@ class MainWindow(QMainWindow):
 
             if is_hidden:
                 self.pnl_toggle_btn.setText("Show Users && P&L")
-                self.table.pnl_hidden = True
                 # Replace ticker values with **** — keep container visible
                 self.ticker_pnl.setText("****")
                 self.ticker_pnl.setStyleSheet("color: #4a5068; font-weight: bold;")
@@ -508,7 +598,6 @@ class MainWindow(QMainWindow):
                 self.ticker_roi.setStyleSheet("color: #4a5068; font-weight: bold;")
             else:
                 self.pnl_toggle_btn.setText("Hide Users && P&L")
-                self.table.pnl_hidden = False
                 # Restore real values from current summaries
                 if hasattr(self, '_current_summaries'):
                     self._update_ticker(self._current_summaries)
@@ -519,9 +608,8 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 self.logger.error(f"set_aliases_hidden failed: {e}", exc_info=True)
 
-            # Refresh table with current data
-            if hasattr(self, '_current_summaries'):
-                self.table.update_data(self._current_summaries)
+            # Re-mask only the alias/ID/P&L/ROI cells; no full table rebuild
+            self.table.set_pnl_hidden(is_hidden)
 
             # Save settings
             self.settings_manager.save_pnl_hidden(is_hidden)
@@ -543,33 +631,29 @@ class MainWindow(QMainWindow):
     
     def _update_table_font(self):
         """Update table font size"""
-        # Update table font
-        table_font = QFont()
-        table_font.setPointSize(self.current_font_size)
+        size = self.current_font_size
+        fonts = self._font_cache.get(size)
+        if fonts is None:
+            table_font = QFont()
+            table_font.setPointSize(size)
+            header_font = QFont()
+            header_font.setPointSize(size)
+            header_font.setBold(True)
+            fonts = self._font_cache[size] = (table_font, header_font)
+        table_font, header_font = fonts
+        
+        # Update table and header font (the table's model applies it to
+        # every cell, including rows added later)
         self.table.setFont(table_font)
-        
-        # Update header font
-        header_font = QFont()
-        header_font.setPointSize(self.current_font_size)
-        header_font.setBold(True)
         self.table.horizontalHeader().setFont(header_font)
         
         # Update font size label
-        self.font_size_label.setText(str(self.current_font_size))
+        self.font_size_label.setText(str(size))
         
         # Adjust row height based on font size
-        row_height = int(self.current_font_size * 3.5)
+        row_height = _ROW_HEIGHT[size]
         self.table.verticalHeader().setDefaultSectionSize(row_height)
         
-        # Force update all existing items to use new font
-        for row in range(self.table.rowCount()):
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item:
-                    item_font = item.font()
-                    item_font.setPointSize(self.current_font_size)
-                    item.setFont(item_font)
-        
         # Force table to repaint
         self.table.viewport().update()
         
@@ -607,8 +691,9 @@ class MainWindow(QMainWindow):
         interval = self.interval_combo.currentData()
         
         if self.poller and self.poller.isRunning():
-            # Update running poller
-            self.poller.set_interval(interval)
+            # Update running poller and cut its current wait short so a
+            # switch from a long interval applies immediately
+            self._apply_poll_interval()
             self.status_bar.set_refresh_status(True, interval)
             self.logger.info("Poll interval changed to %.1fs", interval)
         
@@ -616,16 +701,31 @@ class MainWindow(QMainWindow):
         self.settings_manager.save_polling_interval(interval)
     
     def _show_connection_error(self):
-        """Show connection error dialog"""
-        QMessageBox.warning(
-            self,
-            "Connection Error",
-            "Cannot connect to Stoxxo Bridge.\n\n"
-            "Please make sure:\n"
-            "1. Stoxxo Bridge is running\n"
-            "2. It's accessible at localhost:21000 or localhost:80\n\n"
-            "You can update network settings if needed."
-        )
+        """
+        Show connection error dialog
+        
+        The box is non-modal so no nested event loop runs while queued
+        poller signals are still being delivered.
+        """
+        box = self._connection_error_box
+        if box is None:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Warning)
+            box.setWindowTitle("Connection Error")
+            box.setText(
+                "Cannot connect to Stoxxo Bridge.\n\n"
+                "Please make sure:\n"
+                "1. Stoxxo Bridge is running\n"
+                "2. It's accessible at localhost:21000 or localhost:80\n\n"
+                "You can update network settings if needed."
+            )
+            box.setStandardButtons(QMessageBox.StandardButton.Ok)
+            box.setWindowModality(Qt.WindowModality.NonModal)
+            self._connection_error_box = box
+        
+        box.show()
+        box.raise_()
+        box.activateWindow()
     
     def _on_column_moved(self, logical_index, old_visual_index, new_visual_index):
         """Save settings when column is moved"""
@@ -681,14 +781,22 @@ class MainWindow(QMainWindow):
         """Handle window close event"""
         self.logger.info("Application closing - saving settings...")
         
-        # Save all settings
+        # Save all settings (including any pending debounced alert edits)
         self._save_settings()
+        self.alerts_tab.flush_settings()
         
         # Stop polling if running
         if self.poller and self.poller.isRunning():
             self.logger.info("Stopping polling service...")
-            self.poller.stop()
-            self.poller.wait()
+            self._stop_poller()
+        
+        # Stop the alert service before closing the Telegram client it shares
+        if self.alert_service and self.alert_service.isRunning():
+            self.alert_service.stop()
+            self.alert_service.wait()
+        
+        # Close the shared Telegram client before the interpreter exits
+        close_shared_client()
         
         self.logger.info("Application closed")
         event.accept()
@@ -736,12 +844,13 @@ class MainWindow(QMainWindow):
         
         # Get grid log config
         grid = self.alerts_tab.get_grid_alerts()
+        flags = grid.get_flags()
         grid_config = {
-            'enabled': grid.is_enabled(),
-            'attention': grid.is_attention_enabled(),
-            'error': grid.is_error_enabled(),
-            'warning': grid.is_warning_enabled(),
-            'filter_enabled': grid.is_filter_enabled(),
+            'enabled': bool(flags & grid.FLAG_ENABLED),
+            'attention': bool(flags & grid.FLAG_ATTENTION),
+            'error': bool(flags & grid.FLAG_ERROR),
+            'warning': bool(flags & grid.FLAG_WARNING),
+            'filter_enabled': bool(flags & grid.FLAG_FILTER),
             'filter_keywords': grid.get_filter_keywords()
         }
         
@@ -3,7 +3,7 @@ Polling Service
 Real-time data updates using QThread
 """
 import logging
-import time
+import threading
 from PyQt6.QtCore import QThread, pyqtSignal
 import sys
 import os
@@ -24,6 +24,9 @@ class PollingService(QThread):
     connection_status_changed = pyqtSignal(bool)  # True=connected, False=disconnected
     error_occurred = pyqtSignal(str)  # Error message
     
+    # Upper bound for the poll period while the bridge is unreachable
+    MAX_BACKOFF_SECONDS = 30.0
+    
     def __init__(self, stoxxo_client):
         super().__init__()
         self.client = stoxxo_client
@@ -34,9 +37,11 @@ class PollingService(QThread):
         self.interval_seconds = 1.0  # Default: 1 second
         self.is_running = False
         self._should_stop = False
+        self._wake = threading.Event()  # Set to cut the current wait short
         
         # Connection tracking
         self._last_connection_status = None
+        self._fail_count = 0  # Consecutive failed polls (drives backoff)
     
     def set_interval(self, seconds):
         """
@@ -53,6 +58,23 @@ class PollingService(QThread):
         self.logger.info("Stopping polling service...")
         self._should_stop = True
         self.is_running = False
+        self._wake.set()
+    
+    def wake(self):
+        """Interrupt the current wait and poll again immediately"""
+        self._wake.set()
+    
+    def _next_interval(self):
+        """
+        Get the wait before the next poll
+        
+        Returns the user-selected interval while healthy and doubles it
+        for every consecutive failure, capped at MAX_BACKOFF_SECONDS
+        """
+        if self._fail_count == 0:
+            return self.interval_seconds
+        backoff = self.interval_seconds * (2 ** min(self._fail_count, 16))
+        return min(backoff, max(self.MAX_BACKOFF_SECONDS, self.interval_seconds))
     
     def run(self):
         """
@@ -61,29 +83,47 @@ class PollingService(QThread):
         self.logger.debug("Polling service started")
         self.is_running = True
         self._should_stop = False
+        self._fail_count = 0
+        self._wake.clear()
+        
+        # Bind hot-path callables once instead of resolving them every tick
+        logger = self.logger
+        check_connection = self._check_connection
+        fetch = self.tracker.get_all_users_summary
+        emit_update = self.all_users_updated.emit
+        emit_error = self.error_occurred.emit
+        next_interval = self._next_interval
+        wait = self._wake.wait
+        clear = self._wake.clear
         
         while not self._should_stop:
             try:
                 # Check connection
-                is_connected = self._check_connection()
+                is_connected = check_connection()
                 
                 if is_connected:
                     # Fetch data
-                    summaries = self.tracker.get_all_users_summary()
+                    summaries = fetch()
                     
                     # Emit update signal
-                    self.all_users_updated.emit(summaries)
+                    emit_update(summaries)
+                    self._fail_count = 0
                     
-                    self.logger.debug("Polled data: %d users", len(summaries))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Polled data: %d users", len(summaries))
                 else:
-                    self.logger.warning("Not connected to Stoxxo Bridge")
+                    self._fail_count += 1
+                    logger.warning("Not connected to Stoxxo Bridge (retry in %.1fs)",
+                                   next_interval())
                 
             except Exception as e:
-                self.logger.error("Polling error: %s", str(e))
-                self.error_occurred.emit(str(e))
+                self._fail_count += 1
+                logger.error("Polling error: %s", str(e))
+                emit_error(str(e))
             
-            # Wait for next interval
-            time.sleep(self.interval_seconds)
+            # Wait for next interval (backs off while the bridge is down)
+            wait(next_interval())
+            clear()
         
         self.logger.debug("Polling service stopped")
         self.is_running = False
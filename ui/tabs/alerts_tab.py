@@ -2,63 +2,94 @@
 Alerts Tab
 Contains alert configuration and monitoring
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QSplitter, QFrame
+from PyQt6.QtCore import Qt, QEvent, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from ui.widgets import (TelegramConfigWidget, GridAlertsWidget, 
                         MTMROIAlertsWidget, MarginAlertsWidget,
                         QuantityAlertsWidget)
 from utils.settings_manager import SettingsManager
-from core.telegram_client import TelegramClientSync
+from core.telegram_client import get_shared_client
 import logging
+from contextlib import contextmanager
 
 
-class TelegramVerifyThread(QThread):
-    """Background thread for silently verifying Telegram credentials (no test message)"""
+# Container stylesheet: the resize handles and separators have no sheet of
+# their own and are styled here by objectName. (An application-level rule
+# would lose to the container's QWidget background rule.)
+_RESIZE_HANDLE_QSS = """
+    QFrame#alertsResizeHandle {
+        background-color: #4a5568;
+        margin: 0px 0px;
+    }
+    QFrame#alertsResizeHandle:hover {
+        background-color: #4299e1;
+    }
+"""
+
+_SEPARATOR_QSS = """
+    QFrame#alertsSeparator {
+        color: #4a5568;
+        background-color: #4a5568;
+        max-height: 1px;
+        margin: 5px 0px;
+    }
+"""
+
+_CONTAINER_QSS = "QWidget { background-color: #1a1f2e; }" + _RESIZE_HANDLE_QSS + _SEPARATOR_QSS
+
+
+class _TelegramSignals(QObject):
+    """Signal holder for the Telegram check runnables (QRunnable is not a QObject)"""
     result_ready = pyqtSignal(bool, str)  # success, bot_username or error
 
+
+class TelegramVerifyTask(QRunnable):
+    """Pooled task for silently verifying Telegram credentials (no test message)"""
+
     def __init__(self, bot_token, channel_id):
         super().__init__()
         self.bot_token = bot_token
         self.channel_id = channel_id
+        self.signals = _TelegramSignals()
         self.logger = logging.getLogger(__name__)
 
     def run(self):
         try:
-            client = TelegramClientSync(self.bot_token, self.channel_id)
+            client = get_shared_client(self.bot_token, self.channel_id)
             success, bot_username = client.verify_connection()
             if success and bot_username:
-                self.result_ready.emit(True, bot_username)
+                self.signals.result_ready.emit(True, bot_username)
             else:
-                self.result_ready.emit(False, "Verification failed")
+                self.signals.result_ready.emit(False, "Verification failed")
         except Exception as e:
             self.logger.error(f"Telegram verify error: {e}")
-            self.result_ready.emit(False, str(e))
+            self.signals.result_ready.emit(False, str(e))
 
 
-class TelegramTestThread(QThread):
-    """Background thread for testing Telegram connection"""
-    result_ready = pyqtSignal(bool, str)  # success, bot_username or error
+class TelegramTestTask(QRunnable):
+    """Pooled task for testing Telegram connection"""
     
     def __init__(self, bot_token, channel_id):
         super().__init__()
         self.bot_token = bot_token
         self.channel_id = channel_id
+        self.signals = _TelegramSignals()
         self.logger = logging.getLogger(__name__)
     
     def run(self):
         """Test connection in background"""
         try:
-            client = TelegramClientSync(self.bot_token, self.channel_id)
+            client = get_shared_client(self.bot_token, self.channel_id)
             success, bot_username = client.test_connection()
             
             if success and bot_username:
-                self.result_ready.emit(True, bot_username)
+                self.signals.result_ready.emit(True, bot_username)
             else:
-                self.result_ready.emit(False, "Connection failed")
+                self.signals.result_ready.emit(False, "Connection failed")
                 
         except Exception as e:
             self.logger.error(f"Telegram test error: {e}")
-            self.result_ready.emit(False, str(e))
+            self.signals.result_ready.emit(False, str(e))
 
 
 class AlertsTab(QWidget):
@@ -71,9 +102,49 @@ class AlertsTab(QWidget):
     def __init__(self, settings_manager, parent=None):
         super().__init__(parent)
         self.settings_manager = settings_manager
-        self._current_user_list = []  # Track current users to detect changes
+        self._current_user_list = ()  # Track current users to detect changes
+        self._current_user_set = frozenset()  # Same users, for O(1) compare/lookup
+        
+        # Telegram checks run on the shared pool; flags block double-starts
+        self._pool = QThreadPool.globalInstance()
+        self._verify_busy = False
+        self._verify_creds = None  # (token, channel) being verified
+        self._verify_pending = None  # Latest (token, channel) asked for while busy
+        self._test_busy = False
+        
+        # config_changed coalescing (see _batch)
+        self._suppress_depth = 0
+        self._dirty = False
+        
+        # Debounce saves: a burst of edits (e.g. typing) gives one save + notify
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._flush_config)
+        
+        # Track dragging state
+        self._dragging_handle = None
+        self._drag_start_y = 0
+        self._drag_start_height = 0
+        
+        # Coalesce drag resizes to at most one relayout per frame (~16ms)
+        self._pending_height = None  # (handle_id, height) waiting to be applied
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._apply_pending_resize)
+        
+        # splitterMoved fires on every drag step; persist once it settles
+        self._splitter_save_timer = QTimer(self)
+        self._splitter_save_timer.setSingleShot(True)
+        self._splitter_save_timer.setInterval(250)
+        self._splitter_save_timer.timeout.connect(self._save_splitter_now)
+        self._cached_heights = None  # {'top': int, 'bottom': int} once loaded
+        
+        # Alert sections are built on first show/use (see _ensure_built)
+        self._built = False
+        self._aliases_hidden = False
         self._init_ui()
-        self._load_settings()
     
     def _init_ui(self):
         """Initialize the alerts tab UI"""
@@ -83,17 +154,37 @@ class AlertsTab(QWidget):
         main_layout.setSpacing(0)
         
         # Scroll area for entire content
-        from PyQt6.QtWidgets import QScrollArea, QSplitter
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QScrollArea.Shape.NoFrame)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll_area.setStyleSheet("QScrollArea { background-color: #1a1f2e; }")
+        scroll_area.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
+        self._scroll_area = scroll_area
         
+        # Add scroll area to main layout
+        main_layout.addWidget(scroll_area)
+    
+    def _ensure_built(self):
+        """Build the alert sections and load their settings on first use"""
+        if self._built:
+            return
+        self._built = True
+        self._build_contents()
+        self._load_settings()
+        self.set_aliases_hidden(self._aliases_hidden)
+    
+    def showEvent(self, event):
+        """Build contents the first time the tab is shown"""
+        self._ensure_built()
+        super().showEvent(event)
+    
+    def _build_contents(self):
+        """Create the Telegram and alert sections inside the scroll area"""
         # Container widget for scroll area
         container = QWidget()
-        container.setStyleSheet("QWidget { background-color: #1a1f2e; }")
+        container.setStyleSheet(_CONTAINER_QSS)
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(10, 10, 10, 10)
         container_layout.setSpacing(0)
@@ -172,41 +263,36 @@ class AlertsTab(QWidget):
         container_layout.addStretch()
         
         # Set container to scroll area
-        scroll_area.setWidget(container)
-        
-        # Add scroll area to main layout
-        main_layout.addWidget(scroll_area)
-        
-        # Track dragging state
-        self._dragging_handle = None
-        self._drag_start_y = 0
-        self._drag_start_height = 0
+        self._scroll_area.setWidget(container)
     
     def _create_resize_handle(self, handle_id):
         """Create a draggable resize handle"""
-        from PyQt6.QtWidgets import QFrame
         handle = QFrame()
-        handle.setObjectName(handle_id)
+        handle.setObjectName("alertsResizeHandle")  # Styled by _RESIZE_HANDLE_QSS
+        handle.setProperty("handle_id", handle_id)
         handle.setFrameShape(QFrame.Shape.HLine)
         handle.setFixedHeight(8)
         handle.setCursor(Qt.CursorShape.SizeVerCursor)
-        handle.setStyleSheet("""
-            QFrame {
-                background-color: #4a5568;
-                margin: 0px 0px;
-            }
-            QFrame:hover {
-                background-color: #4299e1;
-            }
-        """)
         
-        # Install event filter for drag handling
-        handle.mousePressEvent = lambda e: self._handle_press(handle_id, e)
-        handle.mouseMoveEvent = lambda e: self._handle_move(handle_id, e)
-        handle.mouseReleaseEvent = lambda e: self._handle_release(handle_id, e)
+        # Drag handling goes through this tab's eventFilter (shared by both handles)
+        handle.installEventFilter(self)
         
         return handle
     
+    def eventFilter(self, obj, event):
+        """Dispatch mouse events from the resize handles"""
+        etype = event.type()
+        if etype == QEvent.Type.MouseMove:
+            self._handle_move(obj.property("handle_id"), event)
+            return True
+        if etype == QEvent.Type.MouseButtonPress:
+            self._handle_press(obj.property("handle_id"), event)
+            return True
+        if etype == QEvent.Type.MouseButtonRelease:
+            self._handle_release(obj.property("handle_id"), event)
+            return True
+        return super().eventFilter(obj, event)
+    
     def _handle_press(self, handle_id, event):
         """Handle mouse press on resize handle"""
         self._dragging_handle = handle_id
@@ -227,14 +313,31 @@ class AlertsTab(QWidget):
         delta = current_y - self._drag_start_y
         new_height = max(250, self._drag_start_height + delta)
         
-        # Apply new height
+        # Defer to the frame timer; later moves just replace the pending height
+        self._pending_height = (handle_id, int(new_height))
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+    
+    def _apply_pending_resize(self):
+        """Apply the latest drag height (frame timer timeout)"""
+        pending, self._pending_height = self._pending_height, None
+        if pending is None:
+            return
+        
+        handle_id, new_height = pending
         if handle_id == 'top':
-            self.top_splitter.setFixedHeight(int(new_height))
+            self.top_splitter.setFixedHeight(new_height)
         else:
-            self.bottom_splitter.setFixedHeight(int(new_height))
+            self.bottom_splitter.setFixedHeight(new_height)
     
     def _handle_release(self, handle_id, event):
         """Handle mouse release"""
+        # Flush the last move so the saved height is the final one
+        self._move_timer.stop()
+        self._apply_pending_resize()
+        if self._splitter_save_timer.isActive():
+            self._save_splitter_now()
+        
         if self._dragging_handle == handle_id:
             # Save final height
             if handle_id == 'top':
@@ -243,23 +346,17 @@ class AlertsTab(QWidget):
             else:
                 height = self.bottom_splitter.height()
                 self.settings_manager.settings.setValue('alerts/height/bottom', height)
+            if self._cached_heights is not None:
+                self._cached_heights[handle_id] = height
         
         self._dragging_handle = None
     
     def _create_separator(self):
         """Create a horizontal separator line"""
-        from PyQt6.QtWidgets import QFrame
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet("""
-            QFrame {
-                color: #4a5568;
-                background-color: #4a5568;
-                max-height: 1px;
-                margin: 5px 0px;
-            }
-        """)
+        separator.setObjectName("alertsSeparator")  # Styled by _SEPARATOR_QSS
         return separator
     
     def _test_populate_users(self):
@@ -275,6 +372,7 @@ class AlertsTab(QWidget):
         Silently verify Telegram credentials and update the indicator.
         Called automatically when engine starts. Does NOT send any message.
         """
+        self._ensure_built()
         bot_token = self.telegram_config.get_bot_token()
         channel_id = self.telegram_config.get_channel_id()
 
@@ -282,12 +380,29 @@ class AlertsTab(QWidget):
             self.telegram_config.set_connection_status(False)
             return
 
-        self.verify_thread = TelegramVerifyThread(bot_token, channel_id)
-        self.verify_thread.result_ready.connect(self._on_verify_result)
-        self.verify_thread.start()
+        if self._verify_busy:
+            # Re-checked in _on_verify_result if the credentials changed
+            self._verify_pending = (bot_token, channel_id)
+            return
+        self._start_verify(bot_token, channel_id)
+
+    def _start_verify(self, bot_token, channel_id):
+        """Run a silent verification on the pool"""
+        self._verify_busy = True
+        self._verify_creds = (bot_token, channel_id)
+
+        task = TelegramVerifyTask(bot_token, channel_id)
+        task.signals.result_ready.connect(self._on_verify_result)
+        self._pool.start(task)
 
     def _on_verify_result(self, success, message):
         """Handle silent verification result"""
+        self._verify_busy = False
+        pending, self._verify_pending = self._verify_pending, None
+        if pending is not None and pending != self._verify_creds:
+            # Credentials changed mid-check; this result is already stale
+            self._start_verify(*pending)
+            return
         if success:
             self.telegram_config.set_connection_status(True, message)
         else:
@@ -303,17 +418,23 @@ class AlertsTab(QWidget):
             self.telegram_config.set_connection_status(False)
             return
         
+        if self._test_busy:
+            return
+        self._test_busy = True
+        
         # Disable button during test
         self.telegram_config.test_button.setEnabled(False)
         self.telegram_config.test_button.setText("Testing...")
         
-        # Run test in background thread
-        self.test_thread = TelegramTestThread(bot_token, channel_id)
-        self.test_thread.result_ready.connect(self._on_test_result)
-        self.test_thread.start()
+        # Run test on the thread pool
+        task = TelegramTestTask(bot_token, channel_id)
+        task.signals.result_ready.connect(self._on_test_result)
+        self._pool.start(task)
     
     def _on_test_result(self, success, message):
-        """Handle test result from background thread"""
+        """Handle test result from background task"""
+        self._test_busy = False
+        
         # Re-enable button
         self.telegram_config.test_button.setEnabled(True)
         self.telegram_config.test_button.setText("Try TG trial alert")
@@ -326,11 +447,57 @@ class AlertsTab(QWidget):
     
     def _on_config_changed(self):
         """Handle configuration changes - auto-save and notify main window"""
-        self._save_settings()
+        if self._suppress_depth:
+            self._dirty = True
+            return
+        self._save_timer.start()
+    
+    def _flush_config(self):
+        """Save settings and notify main window (debounce timer timeout)"""
+        self._save_timer.stop()
+        self._save_settings_now()
         self.config_changed.emit()
     
+    def flush_settings(self):
+        """Write any pending debounced change immediately (call before exit)"""
+        if self._built:
+            self.grid_alerts.flush_pending()
+            self.mtm_roi_alerts.commit_edits()
+            self.margin_alerts.commit_edits()
+            self.quantity_alerts.commit_edits()
+        if self._save_timer.isActive():
+            self._flush_config()
+        if self._splitter_save_timer.isActive():
+            self._save_splitter_now()
+    
+    @contextmanager
+    def _batch(self, flush=True):
+        """
+        Coalesce config changes made inside the block (nestable)
+        
+        On leaving the outermost block, one (debounced) save + config_changed
+        is scheduled if anything changed; with flush=False they are dropped.
+        
+        Args:
+            flush: Save and notify on exit if any change was made
+        """
+        self._suppress_depth += 1
+        try:
+            yield
+        finally:
+            self._suppress_depth -= 1
+            if self._suppress_depth == 0:
+                dirty, self._dirty = self._dirty, False
+                if dirty and flush:
+                    self._save_timer.start()
+    
     def _on_splitter_moved(self):
-        """Handle splitter movement - save horizontal positions only"""
+        """Handle splitter movement - save once the drag settles"""
+        self._splitter_save_timer.start()
+    
+    def _save_splitter_now(self):
+        """Save horizontal splitter positions"""
+        self._splitter_save_timer.stop()
         self.settings_manager.settings.setValue('alerts/splitter/top', self.top_splitter.saveState())
         self.settings_manager.settings.setValue('alerts/splitter/bottom', self.bottom_splitter.saveState())
     
@@ -341,15 +508,13 @@ class AlertsTab(QWidget):
         self.settings_manager.settings.setValue('alerts/splitter/bottom', self.bottom_splitter.saveState())
         
         # Row heights (if fixed)
-        if hasattr(self.top_splitter, 'height'):
-            top_height = self.top_splitter.height()
-            if top_height > 250:  # Only save if manually resized
-                self.settings_manager.settings.setValue('alerts/height/top', top_height)
+        top_height = self.top_splitter.height()
+        if top_height > 250:  # Only save if manually resized
+            self.settings_manager.settings.setValue('alerts/height/top', top_height)
         
-        if hasattr(self.bottom_splitter, 'height'):
-            bottom_height = self.bottom_splitter.height()
-            if bottom_height > 250:
-                self.settings_manager.settings.setValue('alerts/height/bottom', bottom_height)
+        bottom_height = self.bottom_splitter.height()
+        if bottom_height > 250:
+            self.settings_manager.settings.setValue('alerts/height/bottom', bottom_height)
     
     def _load_splitter_positions(self):
         """Load splitter positions and row heights from settings"""
@@ -362,9 +527,15 @@ class AlertsTab(QWidget):
         if bottom_state:
             self.bottom_splitter.restoreState(bottom_state)
         
-        # Row heights
-        top_height = self.settings_manager.settings.value('alerts/height/top', type=int)
-        bottom_height = self.settings_manager.settings.value('alerts/height/bottom', type=int)
+        # Row heights (read from QSettings once, then kept in sync on release)
+        if self._cached_heights is None:
+            settings = self.settings_manager.settings
+            self._cached_heights = {
+                'top': settings.value('alerts/height/top', 0, type=int),
+                'bottom': settings.value('alerts/height/bottom', 0, type=int)
+            }
+        top_height = self._cached_heights['top']
+        bottom_height = self._cached_heights['bottom']
         
         if top_height and top_height > 250:
             self.top_splitter.setFixedHeight(top_height)
@@ -374,22 +545,27 @@ class AlertsTab(QWidget):
     
     def get_telegram_config(self):
         """Get reference to telegram config widget"""
+        self._ensure_built()
         return self.telegram_config
     
     def get_grid_alerts(self):
         """Get reference to grid alerts widget"""
+        self._ensure_built()
         return self.grid_alerts
     
     def get_mtm_roi_alerts(self):
         """Get reference to MTM/ROI alerts widget"""
+        self._ensure_built()
         return self.mtm_roi_alerts
     
     def get_margin_alerts(self):
         """Get reference to margin alerts widget"""
+        self._ensure_built()
         return self.margin_alerts
     
     def get_quantity_alerts(self):
         """Get reference to quantity alerts widget"""
+        self._ensure_built()
         return self.quantity_alerts
     
     def set_aliases_hidden(self, hidden: bool):
@@ -398,24 +574,11 @@ class AlertsTab(QWidget):
         Replaces alias text with ***** rather than hiding the column,
         so the table layout stays intact.
         """
+        self._aliases_hidden = hidden
+        if not self._built:
+            return  # Applied by _ensure_built
         for widget in (self.mtm_roi_alerts, self.margin_alerts, self.quantity_alerts):
-            if not hasattr(widget, 'table'):
-                continue
-            tbl = widget.table
-            for row in range(tbl.rowCount()):
-                item = tbl.item(row, 0)
-                if item is None:
-                    continue
-                if hidden:
-                    # Store real alias if not already masked
-                    if not item.data(32):   # Qt.ItemDataRole.UserRole = 32
-                        item.setData(32, item.text())
-                    item.setText('*****')
-                else:
-                    # Restore real alias from stored value
-                    real = item.data(32)
-                    if real:
-                        item.setText(real)
+            widget.model.set_masked(hidden)
 
     def update_users(self, user_aliases):
         """
@@ -425,52 +588,47 @@ class AlertsTab(QWidget):
         Args:
             user_aliases: List of user alias strings
         """
+        self._ensure_built()
         # Only update if user list has changed
-        if sorted(user_aliases) == sorted(self._current_user_list):
+        incoming = frozenset(user_aliases)
+        if incoming == self._current_user_set:
             # User list unchanged, skip update to preserve scroll position
             return
         
         # User list changed, update tables
-        self._current_user_list = user_aliases.copy()
-        self.mtm_roi_alerts.update_users(user_aliases)
-        self.margin_alerts.update_users(user_aliases)
-        self.quantity_alerts.update_users(user_aliases)
-        
-        # Reload saved thresholds for these users
-        self._reload_thresholds_for_users()
+        self._current_user_list = tuple(user_aliases)
+        self._current_user_set = incoming
+        with self._batch():
+            self.mtm_roi_alerts.update_users(user_aliases)
+            self.margin_alerts.update_users(user_aliases)
+            self.quantity_alerts.update_users(user_aliases)
+            
+            # Reload saved thresholds for these users
+            self._reload_thresholds_for_users()
     
     def _reload_thresholds_for_users(self):
         """Reload saved thresholds after user list updates"""
-        
-        # MTM/ROI alerts
-        enabled, thresholds = self.settings_manager.get_mtm_roi_config()
-        
-        for user_alias, user_thresholds in thresholds.items():
-            if user_alias in self._current_user_list:
-                self.mtm_roi_alerts.set_user_thresholds(user_alias, user_thresholds)
+        with self._batch():
+            # MTM/ROI alerts
+            # Only saved users that are currently shown, one bulk set per table
+            enabled, thresholds = self.settings_manager.get_mtm_roi_config()
+            self.mtm_roi_alerts.set_user_thresholds_bulk(
+                {alias: thresholds[alias] for alias in thresholds.keys() & self._current_user_set})
 
-        # Margin alerts
-        enabled, thresholds = self.settings_manager.get_margin_config()
-        for user_alias, threshold in thresholds.items():
-            if user_alias in self._current_user_list:
-                self.margin_alerts.set_user_threshold(user_alias, threshold)
+            # Margin alerts
+            enabled, thresholds = self.settings_manager.get_margin_config()
+            self.margin_alerts.set_user_thresholds_bulk(
+                {alias: thresholds[alias] for alias in thresholds.keys() & self._current_user_set})
 
-        # Quantity alerts
-        enabled, thresholds = self.settings_manager.get_quantity_config()
-        for user_alias, user_thresholds in thresholds.items():
-            if user_alias in self._current_user_list:
-                self.quantity_alerts.set_user_thresholds(user_alias, user_thresholds)
+            # Quantity alerts
+            enabled, thresholds = self.settings_manager.get_quantity_config()
+            self.quantity_alerts.set_user_thresholds_bulk(
+                {alias: thresholds[alias] for alias in thresholds.keys() & self._current_user_set})
 
     def _load_settings(self):
         """Load all alert settings from SettingsManager"""
-        # Block signals to prevent triggering saves during load
-        self.telegram_config.blockSignals(True)
-        self.grid_alerts.blockSignals(True)
-        self.mtm_roi_alerts.blockSignals(True)
-        self.margin_alerts.blockSignals(True)
-        self.quantity_alerts.blockSignals(True)
-        
-        try:
+        # Drop the change notifications the setters below trigger
+        with self._batch(flush=False):
             # Telegram config
             bot_token, channel_id, sound_enabled = self.settings_manager.get_telegram_config()
             self.telegram_config.set_bot_token(bot_token)
@@ -480,12 +638,13 @@ class AlertsTab(QWidget):
             # Grid log alerts
             (enabled, attention, error, warning, 
              filter_enabled, filter_keywords) = self.settings_manager.get_grid_alerts_config()
-            self.grid_alerts.set_enabled(enabled)
-            self.grid_alerts.set_attention_enabled(attention)
-            self.grid_alerts.set_error_enabled(error)
-            self.grid_alerts.set_warning_enabled(warning)
-            self.grid_alerts.set_filter_enabled(filter_enabled)
-            self.grid_alerts.set_filter_keywords(filter_keywords)
+            with self.grid_alerts.batch():
+                self.grid_alerts.set_enabled(enabled)
+                self.grid_alerts.set_attention_enabled(attention)
+                self.grid_alerts.set_error_enabled(error)
+                self.grid_alerts.set_warning_enabled(warning)
+                self.grid_alerts.set_filter_enabled(filter_enabled)
+                self.grid_alerts.set_filter_keywords(filter_keywords)
             
             # MTM/ROI alerts
             enabled, thresholds = self.settings_manager.get_mtm_roi_config()
@@ -505,16 +664,8 @@ class AlertsTab(QWidget):
             
             # Load splitter positions
             self._load_splitter_positions()
-        
-        finally:
-            # Re-enable signals
-            self.telegram_config.blockSignals(False)
-            self.grid_alerts.blockSignals(False)
-            self.mtm_roi_alerts.blockSignals(False)
-            self.margin_alerts.blockSignals(False)
-            self.quantity_alerts.blockSignals(False)
-    
-    def _save_settings(self):
+    
+    def _save_settings_now(self):
         """Save all alert settings to SettingsManager"""
         # Telegram config
         self.settings_manager.save_telegram_config(
@@ -524,13 +675,15 @@ class AlertsTab(QWidget):
         )
         
         # Grid log alerts
+        grid = self.grid_alerts
+        flags = grid.get_flags()
         self.settings_manager.save_grid_alerts_config(
-            self.grid_alerts.is_enabled(),
-            self.grid_alerts.is_attention_enabled(),
-            self.grid_alerts.is_error_enabled(),
-            self.grid_alerts.is_warning_enabled(),
-            self.grid_alerts.is_filter_enabled(),
-            self.grid_alerts.get_filter_keywords()
+            bool(flags & grid.FLAG_ENABLED),
+            bool(flags & grid.FLAG_ATTENTION),
+            bool(flags & grid.FLAG_ERROR),
+            bool(flags & grid.FLAG_WARNING),
+            bool(flags & grid.FLAG_FILTER),
+            grid.get_filter_keywords()
         )
         
         # MTM/ROI alerts
@@ -1,14 +1,21 @@
 """
 UI Widgets Package
+
+Widgets are imported lazily (PEP 562) on first attribute access, so
+importing the package does not load every widget module up front.
 """
-from .monitoring_table import MonitoringTable
-from .engine_button import EngineButton
-from .status_bar import MonitorStatusBar
-from .telegram_config_widget import TelegramConfigWidget
-from .grid_alerts_widget import GridAlertsWidget
-from .mtm_roi_alerts_widget import MTMROIAlertsWidget
-from .margin_alerts_widget import MarginAlertsWidget
-from .quantity_alerts_widget import QuantityAlertsWidget
+import importlib
+
+_LAZY = {
+    'MonitoringTable': 'ui.widgets.monitoring_table',
+    'EngineButton': 'ui.widgets.engine_button',
+    'MonitorStatusBar': 'ui.widgets.status_bar',
+    'TelegramConfigWidget': 'ui.widgets.telegram_config_widget',
+    'GridAlertsWidget': 'ui.widgets.grid_alerts_widget',
+    'MTMROIAlertsWidget': 'ui.widgets.mtm_roi_alerts_widget',
+    'MarginAlertsWidget': 'ui.widgets.margin_alerts_widget',
+    'QuantityAlertsWidget': 'ui.widgets.quantity_alerts_widget',
+}
 
 __all__ = [
     'MonitoringTable',
@@ -19,4 +26,16 @@ __all__ = [
     'MTMROIAlertsWidget',
     'MarginAlertsWidget',
     'QuantityAlertsWidget'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = obj  # Cache so later lookups skip __getattr__
+    return obj
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -16,6 +16,10 @@ class EngineButton(QPushButton):
     engine_started = pyqtSignal()
     engine_stopped = pyqtSignal()
     
+    # Button captions
+    _TXT_START = "ENGINE START"
+    _TXT_STOP = "ENGINE STOP"
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -33,16 +37,14 @@ class EngineButton(QPushButton):
     def _update_appearance(self):
         """Update button text and properties based on state"""
         if self.is_running:
-            self.setText("ENGINE STOP")
+            self.setText(self._TXT_STOP)
             self.setProperty("running", "true")
         else:
-            self.setText("ENGINE START")
+            self.setText(self._TXT_START)
             self.setProperty("running", "false")
         
-        # Force style refresh
-        self.style().unpolish(self)
+        # Re-match the [running=...] QSS rules; polish alone is enough
         self.style().polish(self)
-        self.update()
     
     def _on_clicked(self):
         """Handle button click"""
@@ -76,53 +78,3 @@ class EngineButton(QPushButton):
             self.start()
         else:
             self.stop()
-
-
-if __name__ == "__main__":
-    # Test the button
-    import sys
-    from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel
-    
-    app = QApplication(sys.argv)
-    
-    # Load stylesheet
-    try:
-        with open('../styles/dark_theme.qss', 'r') as f:
-            app.setStyleSheet(f.read())
-    except:
-        print("Could not load stylesheet")
-    
-    # Create window
-    window = QMainWindow()
-    window.setWindowTitle("ENGINE Button Test")
-    window.setGeometry(100, 100, 400, 300)
-    
-    # Central widget
-    central = QWidget()
-    layout = QVBoxLayout(central)
-    
-    # Status label
-    status_label = QLabel("Status: Stopped")
-    status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    layout.addWidget(status_label)
-    
-    # ENGINE button
-    engine_btn = EngineButton()
-    layout.addWidget(engine_btn)
-    
-    # Connect signals
-    def on_started():
-        status_label.setText("Status: RUNNING")
-        print("Engine started!")
-    
-    def on_stopped():
-        status_label.setText("Status: STOPPED")
-        print("Engine stopped!")
-    
-    engine_btn.engine_started.connect(on_started)
-    engine_btn.engine_stopped.connect(on_stopped)
-    
-    window.setCentralWidget(central)
-    window.show()
-    
-    sys.exit(app.exec())
\ No newline at end of file
@@ -2,9 +2,11 @@
 Grid Log Alerts Widget
 Section for configuring grid log error alerts
 """
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                               QCheckBox, QLineEdit, QGroupBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 
 
 class GridAlertsWidget(QGroupBox):
@@ -15,9 +17,70 @@ class GridAlertsWidget(QGroupBox):
     # Signal
     config_changed = pyqtSignal()
     
+    # Bits of get_flags()
+    FLAG_ENABLED = 0x01
+    FLAG_ATTENTION = 0x02
+    FLAG_ERROR = 0x04
+    FLAG_WARNING = 0x08
+    FLAG_FILTER = 0x10
+    
+    # Quiet period after the last keystroke before the filter change is emitted
+    FILTER_DEBOUNCE_MS = 150
+    
+    # Group box + checkbox stylesheet, parsed once for the whole section
+    _STYLE = """
+        QGroupBox {
+            background-color: #2d3748;
+            border: 1px solid #4a5568;
+            border-radius: 6px;
+            margin-top: 0px;
+            padding-top: 10px;
+        }
+        QCheckBox {
+            color: #ffffff;
+            font-size: 12px;
+            spacing: 8px;
+        }
+        QCheckBox::indicator {
+            width: 18px;
+            height: 18px;
+            border: 2px solid #4a5568;
+            border-radius: 3px;
+            background-color: #1a1f2e;
+        }
+        QCheckBox::indicator:checked {
+            background-color: #4299e1;
+            border-color: #4299e1;
+            image: url(none);
+        }
+        QCheckBox::indicator:hover {
+            border-color: #718096;
+        }
+        QCheckBox::indicator:disabled {
+            background-color: #2d3748;
+            border-color: #4a5568;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTitle("")  # No title, we'll add our own styled header
+        
+        # config_changed coalescing (see batch)
+        self._suppress_emit = False
+        self._pending_emit = False
+        
+        # Parsed filter keywords, rebuilt whenever the filter text changes
+        self._keywords = []
+        # Keywords as of the last filter emission, to drop no-op edits
+        self._emitted_keywords = []
+        
+        # Debounce filter typing so a burst of keystrokes emits once
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._on_filter_text_settled)
+        
         self._init_ui()
     
     def _init_ui(self):
@@ -30,8 +93,7 @@ class GridAlertsWidget(QGroupBox):
         # Enable checkbox
         self.enable_checkbox = QCheckBox("Enable TG alerts for grid log errors")
         self.enable_checkbox.setChecked(True)
-        self.enable_checkbox.setStyleSheet(self._get_checkbox_style())
-        self.enable_checkbox.stateChanged.connect(self._on_config_changed)
+        self._connect_check_state(self.enable_checkbox, self._on_check_state_changed)
         main_layout.addWidget(self.enable_checkbox)
         
         main_layout.addSpacing(8)
@@ -39,20 +101,17 @@ class GridAlertsWidget(QGroupBox):
         # Alert type checkboxes
         self.attention_checkbox = QCheckBox("ATTENTION")
         self.attention_checkbox.setChecked(True)
-        self.attention_checkbox.setStyleSheet(self._get_checkbox_style())
-        self.attention_checkbox.stateChanged.connect(self._on_config_changed)
+        self._connect_check_state(self.attention_checkbox, self._on_check_state_changed)
         main_layout.addWidget(self.attention_checkbox)
         
         self.error_checkbox = QCheckBox("ERROR")
         self.error_checkbox.setChecked(True)
-        self.error_checkbox.setStyleSheet(self._get_checkbox_style())
-        self.error_checkbox.stateChanged.connect(self._on_config_changed)
+        self._connect_check_state(self.error_checkbox, self._on_check_state_changed)
         main_layout.addWidget(self.error_checkbox)
         
         self.warning_checkbox = QCheckBox("WARNING")
         self.warning_checkbox.setChecked(True)
-        self.warning_checkbox.setStyleSheet(self._get_checkbox_style())
-        self.warning_checkbox.stateChanged.connect(self._on_config_changed)
+        self._connect_check_state(self.warning_checkbox, self._on_check_state_changed)
         main_layout.addWidget(self.warning_checkbox)
         
         main_layout.addSpacing(12)
@@ -60,8 +119,8 @@ class GridAlertsWidget(QGroupBox):
         # Filter section
         self.filter_checkbox = QCheckBox("Skips such error alerts which contain below\nstring in grid log error line")
         self.filter_checkbox.setChecked(False)
-        self.filter_checkbox.setStyleSheet(self._get_checkbox_style())
-        self.filter_checkbox.stateChanged.connect(self._on_filter_checkbox_changed)
+        # clicked fires only on user toggles, so set_filter_enabled() stays quiet
+        self.filter_checkbox.clicked.connect(self._on_filter_checkbox_changed)
         main_layout.addWidget(self.filter_checkbox)
         
         main_layout.addSpacing(5)
@@ -70,86 +129,146 @@ class GridAlertsWidget(QGroupBox):
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Enter keywords separated by commas (e.g., ConnectionTimeout, NetworkError)")
         self.filter_input.setEnabled(False)  # Disabled by default
-        self.filter_input.textChanged.connect(self._on_config_changed)
+        self.filter_input.textChanged.connect(self._on_filter_text_changed)
         main_layout.addWidget(self.filter_input)
         
-        # Set group box styling
-        self.setStyleSheet("""
-            QGroupBox {
-                background-color: #2d3748;
-                border: 1px solid #4a5568;
-                border-radius: 6px;
-                margin-top: 0px;
-                padding-top: 10px;
-            }
-        """)
-    
-    def _get_checkbox_style(self):
-        """Get checkbox stylesheet"""
-        return """
-            QCheckBox {
-                color: #ffffff;
-                font-size: 12px;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #4a5568;
-                border-radius: 3px;
-                background-color: #1a1f2e;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #4299e1;
-                border-color: #4299e1;
-                image: url(none);
-            }
-            QCheckBox::indicator:hover {
-                border-color: #718096;
-            }
-            QCheckBox::indicator:disabled {
-                background-color: #2d3748;
-                border-color: #4a5568;
-            }
+        # Set group box styling (also styles all child checkboxes)
+        self.setStyleSheet(self._STYLE)
+        
+        self._refresh_flags()
+    
+    @staticmethod
+    def _connect_check_state(checkbox, slot):
         """
+        Connect a checkbox state change to a slot
+        
+        Uses checkStateChanged where available (Qt 6.7+), falling back
+        to the deprecated stateChanged on older Qt versions.
+        """
+        if hasattr(checkbox, 'checkStateChanged'):
+            checkbox.checkStateChanged.connect(slot)
+        else:
+            checkbox.stateChanged.connect(slot)
     
+    def _refresh_flags(self):
+        """Pack the five checkbox states into self._flags"""
+        self._flags = (
+            (self.FLAG_ENABLED if self.enable_checkbox.isChecked() else 0)
+            | (self.FLAG_ATTENTION if self.attention_checkbox.isChecked() else 0)
+            | (self.FLAG_ERROR if self.error_checkbox.isChecked() else 0)
+            | (self.FLAG_WARNING if self.warning_checkbox.isChecked() else 0)
+            | (self.FLAG_FILTER if self.filter_checkbox.isChecked() else 0)
+        )
+    
+    @pyqtSlot()
+    def _on_check_state_changed(self):
+        """Handle an alert checkbox state change"""
+        self._refresh_flags()
+        self._on_config_changed()
+    
+    @pyqtSlot()
     def _on_filter_checkbox_changed(self):
         """Handle filter checkbox state change"""
+        self._refresh_flags()
         self.filter_input.setEnabled(self.filter_checkbox.isChecked())
         self._on_config_changed()
     
+    @pyqtSlot()
+    def _on_filter_text_changed(self):
+        """Re-parse the keywords and (re)start the debounce timer"""
+        # Split by comma and strip whitespace
+        parts = (part.strip() for part in self.filter_input.text().split(','))
+        keywords = [kw for kw in parts if kw]
+        if keywords == self._keywords:
+            # Whitespace or separator-only edit, nothing to report
+            return
+        self._keywords = keywords
+        if self._suppress_emit:
+            # Inside batch(): let the batch emit once, no timer needed
+            self._emitted_keywords = keywords
+            self._pending_emit = True
+            return
+        self._filter_timer.start()
+    
+    @pyqtSlot()
+    def _on_filter_text_settled(self):
+        """Emit once typing pauses, unless the keywords ended up unchanged"""
+        if self._keywords == self._emitted_keywords:
+            return
+        self._emitted_keywords = self._keywords
+        self._on_config_changed()
+    
+    def flush_pending(self):
+        """Emit a pending debounced filter change immediately"""
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self._on_filter_text_settled()
+    
+    @pyqtSlot()
     def _on_config_changed(self):
         """Emit config changed signal"""
+        if self._suppress_emit:
+            self._pending_emit = True
+            return
         self.config_changed.emit()
     
+    @contextmanager
+    def batch(self):
+        """
+        Collapse config changes made inside the block into one emission
+        
+        config_changed is emitted once on leaving the outermost block,
+        and only if something inside it changed.
+        """
+        outer = not self._suppress_emit
+        self._suppress_emit = True
+        try:
+            yield self
+        finally:
+            if outer:
+                self._suppress_emit = False
+                pending, self._pending_emit = self._pending_emit, False
+                if pending:
+                    self.config_changed.emit()
+    
     # Getters
+    def get_flags(self):
+        """
+        Get all checkbox states packed into one int
+        
+        Returns:
+            Bitwise OR of the FLAG_* constants that are checked
+        """
+        return self._flags
+    
     def is_enabled(self):
         """Check if grid log alerts are enabled"""
-        return self.enable_checkbox.isChecked()
+        return bool(self._flags & self.FLAG_ENABLED)
     
     def is_attention_enabled(self):
         """Check if ATTENTION alerts are enabled"""
-        return self.attention_checkbox.isChecked()
+        return bool(self._flags & self.FLAG_ATTENTION)
     
     def is_error_enabled(self):
         """Check if ERROR alerts are enabled"""
-        return self.error_checkbox.isChecked()
+        return bool(self._flags & self.FLAG_ERROR)
     
     def is_warning_enabled(self):
         """Check if WARNING alerts are enabled"""
-        return self.warning_checkbox.isChecked()
+        return bool(self._flags & self.FLAG_WARNING)
     
     def is_filter_enabled(self):
         """Check if filter is enabled"""
-        return self.filter_checkbox.isChecked()
+        return bool(self._flags & self.FLAG_FILTER)
     
     def get_filter_keywords(self):
-        """Get filter keywords as list"""
-        text = self.filter_input.text().strip()
-        if not text:
-            return []
-        # Split by comma and strip whitespace
-        return [kw.strip() for kw in text.split(',') if kw.strip()]
+        """
+        Get filter keywords as list
+        
+        The list is replaced (never mutated) on each text change, so
+        callers must treat it as read-only.
+        """
+        return self._keywords
     
     # Setters
     def set_enabled(self, enabled):
@@ -171,6 +290,9 @@ class GridAlertsWidget(QGroupBox):
     def set_filter_enabled(self, enabled):
         """Set filter enabled state"""
         self.filter_checkbox.setChecked(enabled)
+        # clicked is not emitted for programmatic changes, so sync here
+        self._refresh_flags()
+        self.filter_input.setEnabled(self.filter_checkbox.isChecked())
     
     def set_filter_keywords(self, keywords):
         """Set filter keywords from list"""
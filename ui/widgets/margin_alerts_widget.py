@@ -2,10 +2,12 @@
 Margin Alerts Widget
 Section for configuring Utilised Margin % threshold alerts per user
 """
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QCheckBox, QTableWidget, 
-                              QTableWidgetItem, QGroupBox, QHeaderView, QLineEdit)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QDoubleValidator
+from PyQt6.QtWidgets import (QVBoxLayout, QCheckBox, QTableView, 
+                              QGroupBox, QHeaderView)
+from PyQt6.QtCore import Qt, QModelIndex, pyqtSignal
+
+from ui.widgets.user_alias_model import UserAliasModel
+from ui.widgets.threshold_delegate import ThresholdDelegate
 
 
 class MarginAlertsWidget(QGroupBox):
@@ -38,18 +40,26 @@ class MarginAlertsWidget(QGroupBox):
         main_layout.addSpacing(8)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels([
+        self.model = UserAliasModel([
             "user\nalias",
             "UT Margin\n% above"
-        ])
+        ], self)
+        self.model.value_edited.connect(self._on_config_changed)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        
+        # Threshold cells are edited in place; one QLineEdit exists only
+        # while a cell is being edited (0-100 for percentage)
+        self.table.setItemDelegateForColumn(1, ThresholdDelegate(0.0, 100.0, 2, self.table))
         
         # Table properties
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QTableView.SelectionMode.NoSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.AllEditTriggers)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(35)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
         self.table.setMinimumHeight(150)
         # Removed setMaximumHeight to allow table to expand with container
         
@@ -67,7 +77,8 @@ class MarginAlertsWidget(QGroupBox):
         
         main_layout.addWidget(self.table)
         
-        # Set group box styling
+        # Set group box styling; also styles the threshold editors in the
+        # table, so they need no stylesheet of their own
         self.setStyleSheet("""
             QGroupBox {
                 background-color: #2d3748;
@@ -76,6 +87,17 @@ class MarginAlertsWidget(QGroupBox):
                 margin-top: 0px;
                 padding-top: 10px;
             }
+            QTableView QLineEdit {
+                background-color: #1a1f2e;
+                color: #e2e8f0;
+                border: 1px solid #4a5568;
+                border-radius: 3px;
+                padding: 4px;
+                font-size: 11px;
+            }
+            QTableView QLineEdit:focus {
+                border-color: #4299e1;
+            }
         """)
     
     def _get_checkbox_style(self):
@@ -103,45 +125,6 @@ class MarginAlertsWidget(QGroupBox):
             }
         """
     
-    def _create_editable_cell(self, value=""):
-        """
-        Create an editable cell with a QLineEdit
-        
-        Args:
-            value: Initial value
-            
-        Returns:
-            QLineEdit widget
-        """
-        line_edit = QLineEdit()
-        line_edit.setText(str(value) if value else "")
-        line_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Validator for numeric input (0-100 for percentage)
-        validator = QDoubleValidator(0.0, 100.0, 2)
-        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
-        line_edit.setValidator(validator)
-        
-        # Style
-        line_edit.setStyleSheet("""
-            QLineEdit {
-                background-color: #1a1f2e;
-                color: #e2e8f0;
-                border: 1px solid #4a5568;
-                border-radius: 3px;
-                padding: 4px;
-                font-size: 11px;
-            }
-            QLineEdit:focus {
-                border-color: #4299e1;
-            }
-        """)
-        
-        # Connect to config changed
-        line_edit.textChanged.connect(self._on_config_changed)
-        
-        return line_edit
-    
     def _on_config_changed(self):
         """Emit config changed signal"""
         self.config_changed.emit()
@@ -154,34 +137,14 @@ class MarginAlertsWidget(QGroupBox):
         Args:
             user_aliases: List of user alias strings
         """
-        # Get current values before clearing
-        current_values = self.get_all_thresholds()
-        
-        # Clear table
-        self.table.setRowCount(0)
-        
-        # Add rows for each user
-        for user_alias in user_aliases:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # User alias (non-editable)
-            alias_item = QTableWidgetItem(user_alias)
-            alias_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            alias_item.setFlags(alias_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            alias_item.setData(32, user_alias)  # store real alias in UserRole
-            self.table.setItem(row, 0, alias_item)
-            
-            # Get saved value for this user if exists
-            saved_value = current_values.get(user_alias, '')
-            
-            # Margin % above
-            margin_input = self._create_editable_cell(saved_value)
-            self.table.setCellWidget(row, 1, margin_input)
-        
-        # Adjust row heights
-        for row in range(self.table.rowCount()):
-            self.table.setRowHeight(row, 35)
+        # The model keeps the values of aliases that are still present and
+        # updates rows in place, so a threshold being typed keeps its editor
+        self.model.set_aliases(user_aliases)
+    
+    def commit_edits(self):
+        """Commit a threshold that is still being edited"""
+        # Moving the current index away commits and closes the open editor
+        self.table.setCurrentIndex(QModelIndex())
     
     def get_all_thresholds(self):
         """
@@ -190,21 +153,9 @@ class MarginAlertsWidget(QGroupBox):
         Returns:
             Dict: {user_alias: margin_percent_above}
         """
-        thresholds = {}
-        
-        for row in range(self.table.rowCount()):
-            # Get user alias
-            alias_item = self.table.item(row, 0)
-            if not alias_item:
-                continue
-            # Read from UserRole so it works even when text is masked as *****
-            user_alias = alias_item.data(32) or alias_item.text()
-            
-            # Get threshold value
-            margin_widget = self.table.cellWidget(row, 1)
-            thresholds[user_alias] = margin_widget.text() if margin_widget else ''
-        
-        return thresholds
+        # Aliases come from the model, so this works even when masked as *****
+        return {user_alias: self.model.value(row, 1)
+                for row, user_alias in enumerate(self.model.aliases())}
     
     def set_user_threshold(self, user_alias, threshold):
         """
@@ -214,17 +165,24 @@ class MarginAlertsWidget(QGroupBox):
             user_alias: User alias string
             threshold: Margin percentage threshold value
         """
-        # Find row for this user
-        for row in range(self.table.rowCount()):
-            alias_item = self.table.item(row, 0)
-            if alias_item and alias_item.text() == user_alias:
-                # Set value
-                margin_input = self.table.cellWidget(row, 1)
-                if margin_input:
-                    margin_input.blockSignals(True)  # Block signal during set
-                    margin_input.setText(str(threshold))
-                    margin_input.blockSignals(False)
-                break
+        row = self.model.row_of(user_alias)
+        if row < 0:
+            return
+        
+        # set_value does not emit value_edited, so no config_changed here
+        self.model.set_value(row, 1, threshold)
+    
+    def set_user_thresholds_bulk(self, mapping):
+        """
+        Set thresholds for many users with a single model update
+        
+        Args:
+            mapping: Dict: {user_alias: margin_percent_above}
+        """
+        self.model.set_values_bulk({
+            user_alias: {1: threshold}
+            for user_alias, threshold in mapping.items()
+        })
     
     def is_enabled(self):
         """Check if margin alerts are enabled"""
@@ -2,9 +2,10 @@
 Monitoring Table Widget
 Main table displaying all users and their options positions
 """
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QLabel, QWidget, QHBoxLayout
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import (QApplication, QTableView, QHeaderView, QStyle,
+                             QStyledItemDelegate, QStyleOptionViewItem)
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRectF, QTimer
+from PyQt6.QtGui import QBrush, QColor, QFont, QFontMetrics, QPainter, QPalette, QPixmap
 import sys
 import os
 
@@ -14,9 +15,12 @@ from utils.formatters import (format_pnl, format_quantity, format_roi, format_ma
                               format_utilised_percent, get_pnl_color, get_quantity_color)
 
 
-class MonitoringTable(QTableWidget):
+class MonitoringTable(QTableView):
     """
-    Table widget for displaying user quantity monitoring data
+    Table view for displaying user quantity monitoring data
+    
+    Backed by a MonitoringTableModel; cells are produced on demand by
+    the model instead of being stored as QTableWidgetItems.
     """
     
     # Column definitions (in display order)
@@ -53,28 +57,58 @@ class MonitoringTable(QTableWidget):
     COL_PUTS_NET = 12
     COL_IMPARITY = 13
     
+    # Initial column widths, in column order
+    COLUMN_WIDTHS = (150, 100, 120, 100, 150, 150, 100, 120, 120, 100, 120, 120, 100, 120)
+    
+    # Columns masked by the "Hide Users & P&L" toggle
+    MASKED_COLUMNS = (COL_USER_ALIAS, COL_USER_ID, COL_PNL, COL_ROI)
+    
+    # Columns painted by NumericCellDelegate
+    NUMERIC_COLUMNS = (COL_PNL, COL_ROI, COL_CALL_SELL, COL_CALL_BUY, COL_CALLS_NET,
+                       COL_PUT_SELL, COL_PUT_BUY, COL_PUTS_NET)
+    
+    # Minimum time between two applied updates; bursts in between are
+    # collapsed into the latest one
+    UPDATE_THROTTLE_MS = 150
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        # P&L visibility state
-        self.pnl_hidden = False
-        
-        # Store previous data for comparison
-        self._previous_data = {}
+        self._model = MonitoringTableModel(self)
+        self.setModel(self._model)
+        self.setItemDelegate(RowCellDelegate(self))
+        self.setItemDelegateForColumn(self.COL_IMPARITY, ImparityOrbDelegate(self))
+        
+        # P&L, ROI and quantity cells change every tick; paint their text
+        # from cached pixmaps
+        numeric_delegate = NumericCellDelegate(self)
+        for col in self.NUMERIC_COLUMNS:
+            self.setItemDelegateForColumn(col, numeric_delegate)
+        
+        # Update throttling (see update_data)
+        self._pending_summaries = None
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.setInterval(self.UPDATE_THROTTLE_MS)
+        self._throttle_timer.timeout.connect(self._on_throttle_timeout)
+        
+        # A model reset scrolls back to the top, so the position is kept
+        # across resets; row inserts, removals and cell changes keep it anyway
+        self._scroll_position = 0
+        self._model.modelAboutToBeReset.connect(self._save_scroll_position)
+        self._model.modelReset.connect(self._restore_scroll_position)
         
         self._setup_table()
     
     def _setup_table(self):
         """Initialize table structure and styling"""
-        # Set column count
-        self.setColumnCount(len(self.COLUMNS))
-        self.setHorizontalHeaderLabels(self.COLUMNS)
+        # Columns and header labels come from the model
         
         # Table properties
         self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.verticalHeader().setVisible(False)
         
         # Prevent text from spilling over - wrap within cell boundaries
@@ -105,355 +139,586 @@ class MonitoringTable(QTableWidget):
         
         # Configure column resize modes
         # Use Interactive mode to allow manual resizing by dragging column edges
-        # ALL columns are now manually resizable
-        header.setSectionResizeMode(self.COL_USER_ALIAS, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_USER_ID, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_PNL, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_ROI, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_AVAILABLE_MARGIN, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_UTILIZED_MARGIN, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_UTILISED_PERCENT, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_CALL_SELL, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_CALL_BUY, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_CALLS_NET, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_PUT_SELL, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_PUT_BUY, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_PUTS_NET, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(self.COL_IMPARITY, QHeaderView.ResizeMode.Interactive)
+        # ALL columns are now manually resizable (one call sets every section)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         
         # Set initial/default column widths (users can resize from these)
-        self.setColumnWidth(self.COL_USER_ALIAS, 150)
-        self.setColumnWidth(self.COL_USER_ID, 100)
-        self.setColumnWidth(self.COL_PNL, 120)
-        self.setColumnWidth(self.COL_ROI, 100)
-        self.setColumnWidth(self.COL_AVAILABLE_MARGIN, 150)
-        self.setColumnWidth(self.COL_UTILIZED_MARGIN, 150)
-        self.setColumnWidth(self.COL_UTILISED_PERCENT, 100)
-        self.setColumnWidth(self.COL_CALL_SELL, 120)
-        self.setColumnWidth(self.COL_CALL_BUY, 120)
-        self.setColumnWidth(self.COL_CALLS_NET, 100)
-        self.setColumnWidth(self.COL_PUT_SELL, 120)
-        self.setColumnWidth(self.COL_PUT_BUY, 120)
-        self.setColumnWidth(self.COL_PUTS_NET, 100)
-        self.setColumnWidth(self.COL_IMPARITY, 120)
-        
-        # Row height
+        for col, width in enumerate(self.COLUMN_WIDTHS):
+            self.setColumnWidth(col, width)
+        
+        # Row height (uniform; Fixed rows still follow setDefaultSectionSize)
         self.verticalHeader().setDefaultSectionSize(35)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    
+    @property
+    def pnl_hidden(self):
+        """True while aliases, user IDs, P&L and ROI are masked"""
+        return self._model.is_masked()
+    
+    @pnl_hidden.setter
+    def pnl_hidden(self, hidden):
+        self.set_pnl_hidden(hidden)
+    
+    def set_pnl_hidden(self, hidden):
+        """
+        Mask or unmask the MASKED_COLUMNS in place
+        
+        Only the four masked columns are repainted; the rest of the
+        table is left untouched.
+        
+        Args:
+            hidden: True to mask aliases, user IDs, P&L and ROI
+        """
+        self._model.set_masked(hidden)
+    
+    def setFont(self, font):
+        """Set the view font and hand it to the model for the cell text"""
+        super().setFont(font)
+        # The app stylesheet fixes the view's font-size, so cells take
+        # their size from FontRole instead
+        self._model.set_font(font)
     
     def update_data(self, summaries):
         """
         Update table with new data
-        Preserves scroll position and only updates changed cells
+        Preserves scroll position and only repaints changed cells
+        
+        Throttled: an update is applied at once unless one was applied in
+        the last UPDATE_THROTTLE_MS, in which case only the latest
+        summaries are kept and applied when that window ends.
         
         Args:
             summaries: List of OptionsPositionSummary objects
         """
-        # Sorting is ALWAYS disabled - we only sort on manual header clicks
-        # This prevents any issues with Qt's automatic sorting
-        
-        # Save scroll position
-        scrollbar = self.verticalScrollBar()
-        scroll_position = scrollbar.value()
-        
-        # Build lookup by user_id for new data
-        new_data = {s.user_id: s for s in summaries}
+        if self._throttle_timer.isActive():
+            self._pending_summaries = summaries
+            return
+        self._model.update_data(summaries)
+        self._throttle_timer.start()
+    
+    def _on_throttle_timeout(self):
+        """Apply the latest summaries that arrived while throttled"""
+        if self._pending_summaries is None:
+            return
+        summaries, self._pending_summaries = self._pending_summaries, None
+        self._model.update_data(summaries)
+        self._throttle_timer.start()
+    
+    def _save_scroll_position(self):
+        """Remember the scroll position before a model reset"""
+        self._scroll_position = self.verticalScrollBar().value()
+    
+    def _restore_scroll_position(self):
+        """Scroll back to where the table was before a model reset"""
+        self.verticalScrollBar().setValue(self._scroll_position)
+    
+    def clear_data(self):
+        """Clear all data from table"""
+        self._pending_summaries = None
+        self._model.clear()
 
-        # Check if we need to rebuild table (different users, count, or hidden state changed)
-        need_rebuild = (
-            len(summaries) != self.rowCount() or
-            set(new_data.keys()) != set(self._previous_data.keys())
-        )
 
-        # Also force rebuild when pnl_hidden changed since last draw
-        if not hasattr(self, '_last_pnl_hidden'):
-            self._last_pnl_hidden = self.pnl_hidden
-        if self._last_pnl_hidden != self.pnl_hidden:
-            need_rebuild = True
-            self._last_pnl_hidden = self.pnl_hidden
-        
-        if need_rebuild:
-            # Full rebuild needed
-            self.setRowCount(0)
-            for summary in summaries:
-                self._add_row(summary)
-        else:
-            # Update by position — order is stable; rebuild is triggered
-            # whenever the user set changes, so row N always == summaries[N].
-            for row in range(self.rowCount()):
-                if row < len(summaries):
-                    self._update_row(row, summaries[row])
-        
-        # Store current data for next comparison
-        self._previous_data = new_data
-        
-        # Restore scroll position
-        scrollbar.setValue(scroll_position)
+class MonitoringTableModel(QAbstractTableModel):
+    """
+    Model holding the formatted cells of the monitoring table
+    
+    Each summary is formatted once per update into a row of
+    (text, color) pairs; data() only looks those up.
+    """
+    
+    # Text shown in MASKED_COLUMNS while masked
+    MASK_TEXT = {
+        MonitoringTable.COL_USER_ALIAS: "●●●●●",
+        MonitoringTable.COL_USER_ID: "●●●●",
+        MonitoringTable.COL_PNL: "xxxx",
+        MonitoringTable.COL_ROI: "xxxx",
+    }
+    
+    # Columns drawn in bold
+    BOLD_COLUMNS = frozenset((
+        MonitoringTable.COL_PNL,
+        MonitoringTable.COL_ROI,
+        MonitoringTable.COL_CALLS_NET,
+        MonitoringTable.COL_PUTS_NET,
+    ))
+    
+    # Columns aligned left (all others are centered)
+    LEFT_COLUMNS = frozenset((MonitoringTable.COL_USER_ALIAS, MonitoringTable.COL_USER_ID))
+    
+    _ALIGN_LEFT = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+    _ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+    
+    # (text, color) formatter per column, applied to _raw_values()
+    _CELL_FORMATTERS = (
+        lambda user_alias: (user_alias, None),
+        lambda user_id: (user_id or "Default", None),
+        lambda pnl: (format_pnl(pnl), get_pnl_color(pnl)),
+        lambda roi: (format_roi(roi), get_pnl_color(roi)),  # Same color logic as P&L
+        lambda margin: (format_margin(margin), None),
+        lambda margin: (format_margin(margin), None),
+        lambda percent: (format_utilised_percent(percent), None),
+        lambda qty: (format_quantity(qty), get_quantity_color(qty)),
+        lambda qty: (format_quantity(qty), get_quantity_color(qty)),
+        lambda qty: (format_quantity(qty), get_quantity_color(qty)),
+        lambda qty: (format_quantity(qty), get_quantity_color(qty)),
+        lambda qty: (format_quantity(qty), get_quantity_color(qty)),
+        lambda qty: (format_quantity(qty), get_quantity_color(qty)),
+        lambda imparity_status: ("", imparity_status),
+    )
+    
+    # Custom role returning every paint role at once (see RowCellDelegate)
+    MULTIPLE_ROLES = Qt.ItemDataRole.UserRole + 100
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys = []    # user_id per row
+        self._rows = []    # [(text, color), ...] per row
+        self._raws = []    # _raw_values() per row, for UserRole
+        self._row_cache = {}  # {raw values: formatted row} from the last update
+        self._masked = False
+        self._colors = {}  # {hex: QColor}
+        
+        # Fonts returned for FontRole; only the properties set here
+        # override the view's font
+        self._font = None
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
     
-    def _add_row(self, summary):
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(MonitoringTable.COLUMNS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        
+        if role == self.MULTIPLE_ROLES:
+            return self._paint_roles(row, col)
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == MonitoringTable.COL_IMPARITY:
+                return None  # Painted as an orb by ImparityOrbDelegate
+            if self._masked and col in self.MASK_TEXT:
+                return self.MASK_TEXT[col]
+            return self._rows[row][col][0]
+        
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if self._masked and col in self.MASK_TEXT:
+                return None
+            color = self._rows[row][col][1]
+            if color is None or col == MonitoringTable.COL_IMPARITY:
+                return None
+            qcolor = self._colors.get(color)
+            if qcolor is None:
+                qcolor = self._colors[color] = QColor(color)
+            return qcolor
+        
+        if role == Qt.ItemDataRole.FontRole:
+            if col in self.BOLD_COLUMNS:
+                return self._bold_font
+            return self._font
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._ALIGN_LEFT if col in self.LEFT_COLUMNS else self._ALIGN_CENTER
+        
+        if role == Qt.ItemDataRole.UserRole:
+            if col == MonitoringTable.COL_IMPARITY:
+                return self._rows[row][col][1]
+            if self._masked and col in self.MASK_TEXT:
+                return self.MASK_TEXT[col]
+            # Sort value: the unformatted number, or lower-cased text
+            if col in self.LEFT_COLUMNS:
+                return self._rows[row][col][0].lower()
+            return self._raws[row][col]
+        
+        return None
+    
+    def _paint_roles(self, row, col):
         """
-        Add a row to the table
+        Get the roles a delegate needs to paint a cell, in one call
         
-        Args:
-            summary: OptionsPositionSummary object
+        Returns:
+            Tuple (text, foreground QColor or None, QFont or None, alignment);
+            text is None for cells without a display value
         """
-        row = self.rowCount()
-        self.insertRow(row)
-        
-        # User Alias (masked when hidden)
-        alias_text = "●●●●●" if self.pnl_hidden else summary.user_alias
-        self._set_cell(row, self.COL_USER_ALIAS, alias_text, align_center=False)
-
-        # User ID (masked when hidden)
-        uid_text = "●●●●" if self.pnl_hidden else (summary.user_id or "Default")
-        self._set_cell(row, self.COL_USER_ID, uid_text, align_center=False)
-        
-        # Live P&L (colored) - check if hidden
-        if self.pnl_hidden:
-            pnl_text = "xxxx"
-            pnl_color = None
-        else:
-            pnl_text = format_pnl(summary.live_pnl)
-            pnl_color = get_pnl_color(summary.live_pnl)
-        self._set_cell(row, self.COL_PNL, pnl_text, color=pnl_color, bold=True)
-        
-        # ROI % (colored, hidden if P&L is hidden)
-        if self.pnl_hidden:
-            roi_text = "xxxx"
-            roi_color = None
-        else:
-            roi_text = format_roi(summary.roi_percent)
-            roi_color = get_pnl_color(summary.roi_percent)  # Same color logic as P&L
-        self._set_cell(row, self.COL_ROI, roi_text, color=roi_color, bold=True)
-        
-        # Available Margin
-        margin_avail_text = format_margin(summary.available_margin)
-        self._set_cell(row, self.COL_AVAILABLE_MARGIN, margin_avail_text)
-        
-        # Utilized Margin
-        margin_util_text = format_margin(summary.utilized_margin)
-        self._set_cell(row, self.COL_UTILIZED_MARGIN, margin_util_text)
-        
-        # Utilised %
-        utilised_pct_text = format_utilised_percent(summary.utilised_percent)
-        self._set_cell(row, self.COL_UTILISED_PERCENT, utilised_pct_text)
-        
-        # Call Sell Qty (negative, red)
-        call_sell_text = format_quantity(summary.call_sell_qty)
-        call_sell_color = get_quantity_color(summary.call_sell_qty)
-        self._set_cell(row, self.COL_CALL_SELL, call_sell_text, color=call_sell_color)
-        
-        # Call Buy Qty (positive, green)
-        call_buy_text = format_quantity(summary.call_buy_qty)
-        call_buy_color = get_quantity_color(summary.call_buy_qty)
-        self._set_cell(row, self.COL_CALL_BUY, call_buy_text, color=call_buy_color)
-        
-        # Calls Net (colored by value)
-        calls_net_text = format_quantity(summary.calls_net)
-        calls_net_color = get_quantity_color(summary.calls_net)
-        self._set_cell(row, self.COL_CALLS_NET, calls_net_text, color=calls_net_color, bold=True)
-        
-        # Put Sell Qty (negative, red)
-        put_sell_text = format_quantity(summary.put_sell_qty)
-        put_sell_color = get_quantity_color(summary.put_sell_qty)
-        self._set_cell(row, self.COL_PUT_SELL, put_sell_text, color=put_sell_color)
-        
-        # Put Buy Qty (positive, green)
-        put_buy_text = format_quantity(summary.put_buy_qty)
-        put_buy_color = get_quantity_color(summary.put_buy_qty)
-        self._set_cell(row, self.COL_PUT_BUY, put_buy_text, color=put_buy_color)
-        
-        # Puts Net (colored by value)
-        puts_net_text = format_quantity(summary.puts_net)
-        puts_net_color = get_quantity_color(summary.puts_net)
-        self._set_cell(row, self.COL_PUTS_NET, puts_net_text, color=puts_net_color, bold=True)
-        
-        # Quantity Imparity (orb indicator)
-        self._set_imparity_cell(row, summary.imparity_status)
-    
-    def _update_row(self, row, summary):
+        align = self._ALIGN_LEFT if col in self.LEFT_COLUMNS else self._ALIGN_CENTER
+        font = self._bold_font if col in self.BOLD_COLUMNS else self._font
+        if col == MonitoringTable.COL_IMPARITY:
+            return None, None, font, align
+        if self._masked and col in self.MASK_TEXT:
+            return self.MASK_TEXT[col], None, font, align
+        
+        text, color = self._rows[row][col]
+        if color is not None:
+            qcolor = self._colors.get(color)
+            if qcolor is None:
+                qcolor = self._colors[color] = QColor(color)
+            color = qcolor
+        return text, color, font, align
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(MonitoringTable.COLUMNS)):
+            return MonitoringTable.COLUMNS[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def update_data(self, summaries):
         """
-        Update an existing row with new data (only updates changed cells)
-        More efficient than rebuilding the entire row
-
+        Replace the table contents with new summaries
+        
+        Users who connect or disconnect are inserted or removed as single
+        rows; the model is only reset when the remaining users change
+        order. Otherwise a single dataChanged covers the cells whose text
+        or color changed.
+        
         Args:
-            row: Row index
-            summary: OptionsPositionSummary object
+            summaries: List of OptionsPositionSummary objects
         """
-        # Update user alias and user ID (respecting hidden state)
-        alias_text = "●●●●●" if self.pnl_hidden else summary.user_alias
-        uid_text   = "●●●●"  if self.pnl_hidden else (summary.user_id or "Default")
-        alias_item = self.item(row, self.COL_USER_ALIAS)
-        uid_item   = self.item(row, self.COL_USER_ID)
-        if alias_item and alias_item.text() != alias_text:
-            self._set_cell(row, self.COL_USER_ALIAS, alias_text, align_center=False)
-        if uid_item and uid_item.text() != uid_text:
-            self._set_cell(row, self.COL_USER_ID, uid_text, align_center=False)
-
-        # Update P&L if changed (respecting hidden state)
-        if self.pnl_hidden:
-            pnl_text = "xxxx"
-            pnl_color = None
-        else:
-            pnl_text = format_pnl(summary.live_pnl)
-            pnl_color = get_pnl_color(summary.live_pnl)
+        keys = [s.user_id for s in summaries]
+        
+        # Reuse last update's formatting for rows whose values are unchanged,
+        # and for the unchanged cells of rows that did change
+        cache = self._row_cache
+        new_cache = {}
+        previous = None
+        rows = []
+        raws = []
+        for key, summary in zip(keys, summaries):
+            raw = self._raw_values(summary)
+            row = cache.get(raw)
+            if row is None:
+                if previous is None:
+                    previous = dict(zip(self._keys, zip(self._raws, self._rows)))
+                row = self._format_row(raw, previous.get(key))
+            new_cache[raw] = row
+            rows.append(row)
+            raws.append(raw)
+        self._row_cache = new_cache
+        
+        if keys != self._keys and not self._move_rows(keys, rows, raws):
+            self.beginResetModel()
+            self._keys = keys
+            self._rows = rows
+            self._raws = raws
+            self.endResetModel()
+            return
+        
+        # Same users in the same order: rows are matched by position
+        old_rows = self._rows
+        self._rows = rows
+        self._raws = raws
+        
+        # One dataChanged for the bounding box of all changed cells; the
+        # view repaints a multi-cell range as one viewport update anyway
+        first_row = last_row = None
+        first_col = len(MonitoringTable.COLUMNS)
+        last_col = -1
+        for row, (old, new) in enumerate(zip(old_rows, rows)):
+            if old is new or old == new:
+                continue
+            changed = [col for col in range(len(new)) if old[col] != new[col]]
+            if first_row is None:
+                first_row = row
+            last_row = row
+            first_col = min(first_col, changed[0])
+            last_col = max(last_col, changed[-1])
+        
+        if first_row is not None:
+            self.dataChanged.emit(
+                self.index(first_row, first_col),
+                self.index(last_row, last_col),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole]
+            )
+    
+    def _move_rows(self, keys, rows, raws):
+        """
+        Remove and insert rows so the model's users match keys
         
-        pnl_item = self.item(row, self.COL_PNL)
-        if pnl_item and pnl_item.text() != pnl_text:
-            self._set_cell(row, self.COL_PNL, pnl_text, color=pnl_color, bold=True)
+        Rows of users still present keep their old contents; the caller
+        diffs them afterwards. Inserted rows already hold their new row.
         
-        # Update ROI % if changed (respecting hidden state)
-        if self.pnl_hidden:
-            roi_text = "xxxx"
-            roi_color = None
-        else:
-            roi_text = format_roi(summary.roi_percent)
-            roi_color = get_pnl_color(summary.roi_percent)
-        
-        roi_item = self.item(row, self.COL_ROI)
-        if roi_item and roi_item.text() != roi_text:
-            self._set_cell(row, self.COL_ROI, roi_text, color=roi_color, bold=True)
-        
-        # Update Available Margin if changed
-        margin_avail_text = format_margin(summary.available_margin)
-        margin_avail_item = self.item(row, self.COL_AVAILABLE_MARGIN)
-        if margin_avail_item and margin_avail_item.text() != margin_avail_text:
-            self._set_cell(row, self.COL_AVAILABLE_MARGIN, margin_avail_text)
-        
-        # Update Utilized Margin if changed
-        margin_util_text = format_margin(summary.utilized_margin)
-        margin_util_item = self.item(row, self.COL_UTILIZED_MARGIN)
-        if margin_util_item and margin_util_item.text() != margin_util_text:
-            self._set_cell(row, self.COL_UTILIZED_MARGIN, margin_util_text)
-        
-        # Update Utilised % if changed
-        utilised_pct_text = format_utilised_percent(summary.utilised_percent)
-        utilised_pct_item = self.item(row, self.COL_UTILISED_PERCENT)
-        if utilised_pct_item and utilised_pct_item.text() != utilised_pct_text:
-            self._set_cell(row, self.COL_UTILISED_PERCENT, utilised_pct_text)
-        
-        # Update Call Sell Qty if changed
-        call_sell_text = format_quantity(summary.call_sell_qty)
-        call_sell_item = self.item(row, self.COL_CALL_SELL)
-        if call_sell_item and call_sell_item.text() != call_sell_text:
-            call_sell_color = get_quantity_color(summary.call_sell_qty)
-            self._set_cell(row, self.COL_CALL_SELL, call_sell_text, color=call_sell_color)
-        
-        # Update Call Buy Qty if changed
-        call_buy_text = format_quantity(summary.call_buy_qty)
-        call_buy_item = self.item(row, self.COL_CALL_BUY)
-        if call_buy_item and call_buy_item.text() != call_buy_text:
-            call_buy_color = get_quantity_color(summary.call_buy_qty)
-            self._set_cell(row, self.COL_CALL_BUY, call_buy_text, color=call_buy_color)
-        
-        # Update Calls Net if changed
-        calls_net_text = format_quantity(summary.calls_net)
-        calls_net_item = self.item(row, self.COL_CALLS_NET)
-        if calls_net_item and calls_net_item.text() != calls_net_text:
-            calls_net_color = get_quantity_color(summary.calls_net)
-            self._set_cell(row, self.COL_CALLS_NET, calls_net_text, color=calls_net_color, bold=True)
-        
-        # Update Put Sell Qty if changed
-        put_sell_text = format_quantity(summary.put_sell_qty)
-        put_sell_item = self.item(row, self.COL_PUT_SELL)
-        if put_sell_item and put_sell_item.text() != put_sell_text:
-            put_sell_color = get_quantity_color(summary.put_sell_qty)
-            self._set_cell(row, self.COL_PUT_SELL, put_sell_text, color=put_sell_color)
-        
-        # Update Put Buy Qty if changed
-        put_buy_text = format_quantity(summary.put_buy_qty)
-        put_buy_item = self.item(row, self.COL_PUT_BUY)
-        if put_buy_item and put_buy_item.text() != put_buy_text:
-            put_buy_color = get_quantity_color(summary.put_buy_qty)
-            self._set_cell(row, self.COL_PUT_BUY, put_buy_text, color=put_buy_color)
-        
-        # Update Puts Net if changed
-        puts_net_text = format_quantity(summary.puts_net)
-        puts_net_item = self.item(row, self.COL_PUTS_NET)
-        if puts_net_item and puts_net_item.text() != puts_net_text:
-            puts_net_color = get_quantity_color(summary.puts_net)
-            self._set_cell(row, self.COL_PUTS_NET, puts_net_text, color=puts_net_color, bold=True)
-        
-        # Update Imparity status if needed (compare widget background color)
-        # For simplicity, always update this (it's a widget, not an item)
-        self._set_imparity_cell(row, summary.imparity_status)
-    
-    def _set_cell(self, row, col, text, color=None, bold=False, align_center=True):
+        Args:
+            keys: New user_id per row
+            rows: New formatted row per key
+            raws: New raw values per key
+        
+        Returns:
+            True if done; False if the table fills from or empties to no
+            rows, user IDs repeat or the users that remain changed order,
+            in which case nothing was changed
         """
-        Set cell value with styling
+        if not self._keys or not keys:
+            return False  # One reset beats a signal per row
+        old_keys = set(self._keys)
+        new_keys = set(keys)
+        if len(old_keys) != len(self._keys) or len(new_keys) != len(keys):
+            return False
+        if ([key for key in self._keys if key in new_keys]
+                != [key for key in keys if key in old_keys]):
+            return False
+        
+        # Remove from the bottom up so the rows above keep their numbers
+        for row in range(len(self._keys) - 1, -1, -1):
+            if self._keys[row] not in new_keys:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._keys[row]
+                del self._rows[row]
+                del self._raws[row]
+                self.endRemoveRows()
+        
+        # Insert top down; the users before each new row are already in place
+        for row, key in enumerate(keys):
+            if key not in old_keys:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._keys.insert(row, key)
+                self._rows.insert(row, rows[row])
+                self._raws.insert(row, raws[row])
+                self.endInsertRows()
+        
+        return True
+    
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self._keys = []
+        self._rows = []
+        self._raws = []
+        self._row_cache = {}
+        self.endResetModel()
+    
+    def set_masked(self, masked):
+        """
+        Mask or restore the MASKED_COLUMNS
         
         Args:
-            row: Row index
-            col: Column index
-            text: Cell text
-            color: Text color (hex string)
-            bold: Make text bold
-            align_center: Center align text
+            masked: True to show placeholder text instead of the values
         """
-        item = QTableWidgetItem(str(text))
+        masked = bool(masked)
+        if masked == self._masked:
+            return
+        self._masked = masked
+        
+        if self._rows:
+            first = min(self.MASK_TEXT)
+            last = max(self.MASK_TEXT)
+            self.dataChanged.emit(
+                self.index(0, first),
+                self.index(len(self._rows) - 1, last),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole]
+            )
+    
+    def is_masked(self):
+        """Check if the MASKED_COLUMNS are masked"""
+        return self._masked
+    
+    def set_font(self, font):
+        """
+        Set the font used for cell text
         
-        # Alignment
-        if align_center:
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        else:
-            item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        
-        # Color
-        if color:
-            item.setForeground(QColor(color))
-        
-        # Bold
-        if bold:
-            font = item.font()
-            font.setBold(True)
-            item.setFont(font)
-        
-        # Store numeric value for proper sorting
-        # Try to convert to float for numeric columns
-        try:
-            # Remove formatting characters like +, -, %, commas
-            clean_text = str(text).replace('+', '').replace('%', '').replace(',', '')
-            numeric_value = float(clean_text)
-            item.setData(Qt.ItemDataRole.UserRole, numeric_value)
-        except (ValueError, AttributeError):
-            # Not a number, store as string for alphabetical sorting
-            item.setData(Qt.ItemDataRole.UserRole, str(text))
-        
-        # Prevent text overflow - will show ellipsis (...) if too long
-        # This works in conjunction with setWordWrap for best results
-        
-        self.setItem(row, col, item)
-    
-    def _set_imparity_cell(self, row, status):
+        Args:
+            font: QFont for regular cells; bold cells use a bold copy
         """
-        Set imparity indicator cell with colored orb
+        self._font = QFont(font)
+        self._bold_font = QFont(font)
+        self._bold_font.setBold(True)
+        
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, len(MonitoringTable.COLUMNS) - 1),
+                [Qt.ItemDataRole.FontRole]
+            )
+    
+    @staticmethod
+    def _raw_values(summary):
+        """
+        Get the summary values shown in the table, one per column
         
         Args:
-            row: Row index
-            status: 'green' or 'red'
+            summary: OptionsPositionSummary object
+        
+        Returns:
+            Tuple in column order, usable as a cache key
         """
-        # Create widget for visual display
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Create orb label
-        orb = QLabel()
-        if status == 'green':
-            orb.setText("  ")  # Empty text, just the colored circle
-            orb.setStyleSheet("background-color: #48bb78; border-radius: 10px; min-width: 20px; min-height: 20px;")
-        else:
-            orb.setText("  ")  # Empty text, just the colored circle
-            orb.setStyleSheet("background-color: #f56565; border-radius: 10px; min-width: 20px; min-height: 20px;")
+        return (
+            summary.user_alias,
+            summary.user_id,
+            summary.live_pnl,
+            summary.roi_percent,
+            summary.available_margin,
+            summary.utilized_margin,
+            summary.utilised_percent,
+            summary.call_sell_qty,
+            summary.call_buy_qty,
+            summary.calls_net,
+            summary.put_sell_qty,
+            summary.put_buy_qty,
+            summary.puts_net,
+            summary.imparity_status,
+        )
+    
+    @classmethod
+    def _format_row(cls, raw, previous=None):
+        """
+        Format one row of raw values into (text, color) cells
         
-        layout.addWidget(orb)
+        Args:
+            raw: Tuple from _raw_values()
+            previous: Optional (raw, row) last shown for the same user;
+                cells whose raw value is unchanged are reused from it
         
-        # Set widget in cell
-        self.setCellWidget(row, self.COL_IMPARITY, widget)
+        Returns:
+            Tuple of (text, color) per column; color is a hex string or None.
+            The imparity cell carries its status in place of the color.
+        """
+        if previous is None:
+            return tuple(format_cell(value) for format_cell, value in zip(cls._CELL_FORMATTERS, raw))
+        
+        old_raw, old_row = previous
+        return tuple(
+            old_cell if value == old_value else format_cell(value)
+            for format_cell, value, old_value, old_cell
+            in zip(cls._CELL_FORMATTERS, raw, old_raw, old_row)
+        )
+
+
+class RowCellDelegate(QStyledItemDelegate):
+    """
+    Item delegate that fetches all paint roles with a single data() call
     
-    def clear_data(self):
-        """Clear all data from table"""
-        self.setRowCount(0)
+    The stock initStyleOption() asks the model for each role separately,
+    and each of those is a Python call into MonitoringTableModel.data().
+    Here one MULTIPLE_ROLES lookup fills the option instead.
+    """
+    
+    def initStyleOption(self, option, index):
+        roles = index.data(MonitoringTableModel.MULTIPLE_ROLES)
+        if roles is None:
+            super().initStyleOption(option, index)
+            return
+        text, color, font, align = roles
+        
+        option.index = index
+        if font is not None:
+            option.font = font.resolve(option.font)
+            option.fontMetrics = QFontMetrics(option.font)
+        option.displayAlignment = align
+        if color is not None:
+            palette = QPalette(option.palette)
+            palette.setBrush(QPalette.ColorRole.Text, QBrush(color))
+            option.palette = palette
+        if text is not None:
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+            option.text = text
+
+
+class NumericCellDelegate(RowCellDelegate):
+    """
+    Paints cell text from QPixmaps cached by text, color, font and size
+    
+    Numbers repeat a lot between ticks (and across users), so most paints
+    become one drawPixmap instead of a text layout. The background and
+    hover are still drawn by the style; selected cells are not cached.
+    """
+    
+    # Cached pixmaps are dropped all at once past this many entries
+    CACHE_LIMIT = 2048
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache = {}
+    
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        if opt.state & QStyle.StateFlag.State_Selected or not opt.text:
+            # Selected text uses other colors; not worth caching
+            super().paint(painter, option, index)
+            return
+        
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        
+        # Background and hover only
+        text = opt.text
+        opt.text = ""
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+        opt.text = text
+        
+        if not opt.state & QStyle.StateFlag.State_Enabled:
+            group = QPalette.ColorGroup.Disabled
+        elif not opt.state & QStyle.StateFlag.State_Active:
+            group = QPalette.ColorGroup.Inactive
+        else:
+            group = QPalette.ColorGroup.Normal
+        color = opt.palette.color(group, QPalette.ColorRole.Text)
+        
+        dpr = painter.device().devicePixelRatioF()
+        key = (text, color.rgba(), int(group.value), opt.font.key(),
+               opt.rect.width(), opt.rect.height(), int(opt.displayAlignment.value), dpr)
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            pixmap = self._render(opt, style, dpr)
+            if len(self._cache) >= self.CACHE_LIMIT:
+                self._cache.clear()
+            self._cache[key] = pixmap
+        painter.drawPixmap(opt.rect.topLeft(), pixmap)
+    
+    @staticmethod
+    def _render(opt, style, dpr):
+        """Have the style draw just the cell text into a transparent pixmap"""
+        pixmap = QPixmap(round(opt.rect.width() * dpr), round(opt.rect.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        text_opt = QStyleOptionViewItem(opt)
+        text_opt.rect = opt.rect.translated(-opt.rect.topLeft())
+        text_opt.state &= ~(QStyle.StateFlag.State_MouseOver | QStyle.StateFlag.State_HasFocus)
+        text_opt.backgroundBrush = QBrush()
+        
+        painter = QPainter(pixmap)
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, text_opt, painter, opt.widget)
+        painter.end()
+        return pixmap
+
+
+class ImparityOrbDelegate(RowCellDelegate):
+    """
+    Paints the quantity imparity status as a colored orb
+    """
+    
+    ORB_SIZE = 20
+    ORB_COLORS = {
+        'green': QColor("#48bb78"),
+    }
+    ORB_COLOR_DEFAULT = QColor("#f56565")  # Anything but green is red
+    
+    def paint(self, painter, option, index):
+        # Background, hover and selection as for any other cell
+        super().paint(painter, option, index)
+        
+        status = index.data(Qt.ItemDataRole.UserRole)
+        color = self.ORB_COLORS.get(status, self.ORB_COLOR_DEFAULT)
+        
+        rect = QRectF(0, 0, self.ORB_SIZE, self.ORB_SIZE)
+        rect.moveCenter(QRectF(option.rect).center())
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+        painter.drawEllipse(rect)
+        painter.restore()
 
 
 if __name__ == "__main__":
@@ -2,11 +2,13 @@
 MTM & ROI Alerts Widget
 Section for configuring MTM and ROI% threshold alerts per user
 """
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                              QCheckBox, QTableWidget, QTableWidgetItem, 
-                              QGroupBox, QHeaderView, QLineEdit)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QDoubleValidator
+from PyQt6.QtWidgets import (QVBoxLayout, QLabel, 
+                              QCheckBox, QTableView, 
+                              QGroupBox, QHeaderView)
+from PyQt6.QtCore import Qt, QModelIndex, pyqtSignal
+
+from ui.widgets.user_alias_model import UserAliasModel
+from ui.widgets.threshold_delegate import ThresholdDelegate
 
 
 class MTMROIAlertsWidget(QGroupBox):
@@ -17,13 +19,13 @@ class MTMROIAlertsWidget(QGroupBox):
     # Signal
     config_changed = pyqtSignal()
     
+    # Threshold keys in column order (columns 1-4)
+    THRESHOLD_KEYS = ('mtm_above', 'mtm_below', 'roi_above', 'roi_below')
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTitle("")
         self._init_ui()
-        
-        # Store user data
-        self._user_thresholds = {}  # {user_alias: {mtm_above, mtm_below, roi_above, roi_below}}
     
     def _init_ui(self):
         """Initialize the UI"""
@@ -42,21 +44,31 @@ class MTMROIAlertsWidget(QGroupBox):
         main_layout.addSpacing(8)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
+        self.model = UserAliasModel([
             "user\nalias",
             "MTM\nabove",
             "MTM\nbelow",
             "ROI%\nabove",
             "ROI%\nbelow"
-        ])
+        ], self)
+        self.model.value_edited.connect(self._on_config_changed)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        
+        # Threshold cells are edited in place; one QLineEdit exists only
+        # while a cell is being edited (allows negative, positive, decimal, empty)
+        threshold_delegate = ThresholdDelegate(parent=self.table)
+        for col in range(1, 5):
+            self.table.setItemDelegateForColumn(col, threshold_delegate)
         
         # Table properties
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QTableView.SelectionMode.NoSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.AllEditTriggers)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(35)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
         self.table.setMinimumHeight(150)
         # Removed setMaximumHeight to allow table to expand with container
         
@@ -86,7 +98,8 @@ class MTMROIAlertsWidget(QGroupBox):
         """)
         main_layout.addWidget(note_label)
         
-        # Set group box styling
+        # Set group box styling; also styles the threshold editors in the
+        # table, so they need no stylesheet of their own
         self.setStyleSheet("""
             QGroupBox {
                 background-color: #2d3748;
@@ -95,6 +108,17 @@ class MTMROIAlertsWidget(QGroupBox):
                 margin-top: 0px;
                 padding-top: 10px;
             }
+            QTableView QLineEdit {
+                background-color: #1a1f2e;
+                color: #e2e8f0;
+                border: 1px solid #4a5568;
+                border-radius: 3px;
+                padding: 4px;
+                font-size: 11px;
+            }
+            QTableView QLineEdit:focus {
+                border-color: #4299e1;
+            }
         """)
     
     def _get_checkbox_style(self):
@@ -122,45 +146,6 @@ class MTMROIAlertsWidget(QGroupBox):
             }
         """
     
-    def _create_editable_cell(self, value=""):
-        """
-        Create an editable cell with a QLineEdit
-        
-        Args:
-            value: Initial value
-            
-        Returns:
-            QLineEdit widget
-        """
-        line_edit = QLineEdit()
-        line_edit.setText(str(value) if value else "")
-        line_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Validator for numeric input (allows negative, positive, decimal, empty)
-        validator = QDoubleValidator()
-        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
-        line_edit.setValidator(validator)
-        
-        # Style
-        line_edit.setStyleSheet("""
-            QLineEdit {
-                background-color: #1a1f2e;
-                color: #e2e8f0;
-                border: 1px solid #4a5568;
-                border-radius: 3px;
-                padding: 4px;
-                font-size: 11px;
-            }
-            QLineEdit:focus {
-                border-color: #4299e1;
-            }
-        """)
-        
-        # Connect to config changed
-        line_edit.textChanged.connect(self._on_config_changed)
-        
-        return line_edit
-    
     def _on_config_changed(self):
         """Emit config changed signal"""
         self.config_changed.emit()
@@ -173,46 +158,14 @@ class MTMROIAlertsWidget(QGroupBox):
         Args:
             user_aliases: List of user alias strings
         """
-        # Get current values before clearing
-        current_values = self.get_all_thresholds()
-        
-        # Clear table
-        self.table.setRowCount(0)
-        
-        # Add rows for each user
-        for user_alias in user_aliases:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # User alias (non-editable)
-            alias_item = QTableWidgetItem(user_alias)
-            alias_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            alias_item.setFlags(alias_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            alias_item.setData(32, user_alias)  # store real alias in UserRole
-            self.table.setItem(row, 0, alias_item)
-            
-            # Get saved values for this user if they exist
-            saved = current_values.get(user_alias, {})
-            
-            # MTM above
-            mtm_above_input = self._create_editable_cell(saved.get('mtm_above', ''))
-            self.table.setCellWidget(row, 1, mtm_above_input)
-            
-            # MTM below
-            mtm_below_input = self._create_editable_cell(saved.get('mtm_below', ''))
-            self.table.setCellWidget(row, 2, mtm_below_input)
-            
-            # ROI% above
-            roi_above_input = self._create_editable_cell(saved.get('roi_above', ''))
-            self.table.setCellWidget(row, 3, roi_above_input)
-            
-            # ROI% below
-            roi_below_input = self._create_editable_cell(saved.get('roi_below', ''))
-            self.table.setCellWidget(row, 4, roi_below_input)
-        
-        # Adjust row heights
-        for row in range(self.table.rowCount()):
-            self.table.setRowHeight(row, 35)
+        # The model keeps the values of aliases that are still present and
+        # updates rows in place, so a threshold being typed keeps its editor
+        self.model.set_aliases(user_aliases)
+    
+    def commit_edits(self):
+        """Commit a threshold that is still being edited"""
+        # Moving the current index away commits and closes the open editor
+        self.table.setCurrentIndex(QModelIndex())
     
     def get_all_thresholds(self):
         """
@@ -223,25 +176,11 @@ class MTMROIAlertsWidget(QGroupBox):
         """
         thresholds = {}
         
-        for row in range(self.table.rowCount()):
-            # Get user alias
-            alias_item = self.table.item(row, 0)
-            if not alias_item:
-                continue
-            # Read from UserRole so it works even when text is masked as *****
-            user_alias = alias_item.data(32) or alias_item.text()
-            
-            # Get threshold values
-            mtm_above_widget = self.table.cellWidget(row, 1)
-            mtm_below_widget = self.table.cellWidget(row, 2)
-            roi_above_widget = self.table.cellWidget(row, 3)
-            roi_below_widget = self.table.cellWidget(row, 4)
-            
+        # Aliases come from the model, so this works even when masked as *****
+        for row, user_alias in enumerate(self.model.aliases()):
             thresholds[user_alias] = {
-                'mtm_above': mtm_above_widget.text() if mtm_above_widget else '',
-                'mtm_below': mtm_below_widget.text() if mtm_below_widget else '',
-                'roi_above': roi_above_widget.text() if roi_above_widget else '',
-                'roi_below': roi_below_widget.text() if roi_below_widget else ''
+                key: self.model.value(row, col)
+                for col, key in enumerate(self.THRESHOLD_KEYS, 1)
             }
         
         return thresholds
@@ -254,59 +193,29 @@ class MTMROIAlertsWidget(QGroupBox):
             user_alias: User alias string
             thresholds: Dict with keys: mtm_above, mtm_below, roi_above, roi_below
         """
+        row = self.model.row_of(user_alias)
+        if row < 0:
+            return
         
-        # Find row for this user
-        found = False
-        for row in range(self.table.rowCount()):
-            alias_item = self.table.item(row, 0)
-            if alias_item and alias_item.text() == user_alias:
-                found = True
-                
-                # BLOCK SIGNALS while setting all values to prevent intermediate saves
-                mtm_above = self.table.cellWidget(row, 1)
-                mtm_below = self.table.cellWidget(row, 2)
-                roi_above = self.table.cellWidget(row, 3)
-                roi_below = self.table.cellWidget(row, 4)
-                
-                # Block all widgets
-                if mtm_above:
-                    mtm_above.blockSignals(True)
-                if mtm_below:
-                    mtm_below.blockSignals(True)
-                if roi_above:
-                    roi_above.blockSignals(True)
-                if roi_below:
-                    roi_below.blockSignals(True)
-                
-                # Set values
-                if mtm_above:
-                    value = str(thresholds.get('mtm_above', ''))
-                    mtm_above.setText(value)
-                
-                if mtm_below:
-                    value = str(thresholds.get('mtm_below', ''))
-                    mtm_below.setText(value)
-                
-                if roi_above:
-                    value = str(thresholds.get('roi_above', ''))
-                    roi_above.setText(value)
-                
-                if roi_below:
-                    value = str(thresholds.get('roi_below', ''))
-                    roi_below.setText(value)
-                
-                # Unblock all widgets
-                if mtm_above:
-                    mtm_above.blockSignals(False)
-                if mtm_below:
-                    mtm_below.blockSignals(False)
-                if roi_above:
-                    roi_above.blockSignals(False)
-                if roi_below:
-                    roi_below.blockSignals(False)
-                
-                break
+        # set_value does not emit value_edited, so no config_changed here
+        for col, key in enumerate(self.THRESHOLD_KEYS, 1):
+            self.model.set_value(row, col, str(thresholds.get(key, '')))
+    
+    def set_user_thresholds_bulk(self, mapping):
+        """
+        Set thresholds for many users with a single model update
         
+        Args:
+            mapping: Dict: {user_alias: {mtm_above, mtm_below, roi_above, roi_below}}
+        """
+        self.model.set_values_bulk({
+            user_alias: {
+                col: str(thresholds.get(key, ''))
+                for col, key in enumerate(self.THRESHOLD_KEYS, 1)
+            }
+            for user_alias, thresholds in mapping.items()
+        })
+    
     def is_enabled(self):
         """Check if MTM/ROI alerts are enabled"""
         return self.enable_checkbox.isChecked()
@@ -2,10 +2,12 @@
 Quantity Alerts Widget
 Section for configuring live position quantity threshold alerts per user
 """
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QCheckBox, QTableWidget, 
-                              QTableWidgetItem, QGroupBox, QHeaderView, QLineEdit)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIntValidator
+from PyQt6.QtWidgets import (QVBoxLayout, QCheckBox, QTableView, 
+                              QGroupBox, QHeaderView)
+from PyQt6.QtCore import Qt, QModelIndex, pyqtSignal
+
+from ui.widgets.user_alias_model import UserAliasModel
+from ui.widgets.threshold_delegate import ThresholdDelegate
 
 
 class QuantityAlertsWidget(QGroupBox):
@@ -16,6 +18,9 @@ class QuantityAlertsWidget(QGroupBox):
     # Signal
     config_changed = pyqtSignal()
     
+    # Threshold keys in column order (columns 1-6)
+    THRESHOLD_KEYS = ('calls_sell', 'puts_sell', 'calls_buy', 'puts_buy', 'calls_net', 'puts_net')
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTitle("")
@@ -38,9 +43,7 @@ class QuantityAlertsWidget(QGroupBox):
         main_layout.addSpacing(8)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
+        self.model = UserAliasModel([
             "user\nalias",
             "calls sell\nquantity\nabove",
             "puts sell\nquantity\nabove",
@@ -48,13 +51,25 @@ class QuantityAlertsWidget(QGroupBox):
             "puts buy\nquantity\nabove",
             "calls net\nquantity\nabove",
             "puts net\nquantity\nabove"
-        ])
+        ], self)
+        self.model.value_edited.connect(self._on_config_changed)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        
+        # Threshold cells are edited in place; one QLineEdit exists only
+        # while a cell is being edited (positive whole numbers only)
+        threshold_delegate = ThresholdDelegate(0, 999999, 0, self.table)
+        for col in range(1, 7):
+            self.table.setItemDelegateForColumn(col, threshold_delegate)
         
         # Table properties
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QTableView.SelectionMode.NoSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.AllEditTriggers)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(35)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
         self.table.setMinimumHeight(150)
         # Removed setMaximumHeight to allow table to expand with container
         
@@ -77,7 +92,8 @@ class QuantityAlertsWidget(QGroupBox):
         
         main_layout.addWidget(self.table)
         
-        # Set group box styling
+        # Set group box styling; also styles the threshold editors in the
+        # table, so they need no stylesheet of their own
         self.setStyleSheet("""
             QGroupBox {
                 background-color: #2d3748;
@@ -86,6 +102,17 @@ class QuantityAlertsWidget(QGroupBox):
                 margin-top: 0px;
                 padding-top: 10px;
             }
+            QTableView QLineEdit {
+                background-color: #1a1f2e;
+                color: #e2e8f0;
+                border: 1px solid #4a5568;
+                border-radius: 3px;
+                padding: 4px;
+                font-size: 11px;
+            }
+            QTableView QLineEdit:focus {
+                border-color: #4299e1;
+            }
         """)
     
     def _get_checkbox_style(self):
@@ -113,44 +140,6 @@ class QuantityAlertsWidget(QGroupBox):
             }
         """
     
-    def _create_editable_cell(self, value=""):
-        """
-        Create an editable cell with a QLineEdit
-        
-        Args:
-            value: Initial value
-            
-        Returns:
-            QLineEdit widget
-        """
-        line_edit = QLineEdit()
-        line_edit.setText(str(value) if value else "")
-        line_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Validator for positive integer input only (quantities must be positive)
-        validator = QIntValidator(0, 999999)
-        line_edit.setValidator(validator)
-        
-        # Style
-        line_edit.setStyleSheet("""
-            QLineEdit {
-                background-color: #1a1f2e;
-                color: #e2e8f0;
-                border: 1px solid #4a5568;
-                border-radius: 3px;
-                padding: 4px;
-                font-size: 11px;
-            }
-            QLineEdit:focus {
-                border-color: #4299e1;
-            }
-        """)
-        
-        # Connect to config changed
-        line_edit.textChanged.connect(self._on_config_changed)
-        
-        return line_edit
-    
     def _on_config_changed(self):
         """Emit config changed signal"""
         self.config_changed.emit()
@@ -163,54 +152,14 @@ class QuantityAlertsWidget(QGroupBox):
         Args:
             user_aliases: List of user alias strings
         """
-        # Get current values before clearing
-        current_values = self.get_all_thresholds()
-        
-        # Clear table
-        self.table.setRowCount(0)
-        
-        # Add rows for each user
-        for user_alias in user_aliases:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # User alias (non-editable)
-            alias_item = QTableWidgetItem(user_alias)
-            alias_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            alias_item.setFlags(alias_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            alias_item.setData(32, user_alias)  # store real alias in UserRole
-            self.table.setItem(row, 0, alias_item)
-            
-            # Get saved values for this user if they exist
-            saved = current_values.get(user_alias, {})
-            
-            # Calls sell quantity above
-            calls_sell_input = self._create_editable_cell(saved.get('calls_sell', ''))
-            self.table.setCellWidget(row, 1, calls_sell_input)
-            
-            # Puts sell quantity above
-            puts_sell_input = self._create_editable_cell(saved.get('puts_sell', ''))
-            self.table.setCellWidget(row, 2, puts_sell_input)
-            
-            # Calls buy quantity above
-            calls_buy_input = self._create_editable_cell(saved.get('calls_buy', ''))
-            self.table.setCellWidget(row, 3, calls_buy_input)
-            
-            # Puts buy quantity above
-            puts_buy_input = self._create_editable_cell(saved.get('puts_buy', ''))
-            self.table.setCellWidget(row, 4, puts_buy_input)
-            
-            # Calls net quantity above
-            calls_net_input = self._create_editable_cell(saved.get('calls_net', ''))
-            self.table.setCellWidget(row, 5, calls_net_input)
-            
-            # Puts net quantity above
-            puts_net_input = self._create_editable_cell(saved.get('puts_net', ''))
-            self.table.setCellWidget(row, 6, puts_net_input)
-        
-        # Adjust row heights
-        for row in range(self.table.rowCount()):
-            self.table.setRowHeight(row, 35)
+        # The model keeps the values of aliases that are still present and
+        # updates rows in place, so a threshold being typed keeps its editor
+        self.model.set_aliases(user_aliases)
+    
+    def commit_edits(self):
+        """Commit a threshold that is still being edited"""
+        # Moving the current index away commits and closes the open editor
+        self.table.setCurrentIndex(QModelIndex())
     
     def get_all_thresholds(self):
         """
@@ -221,29 +170,11 @@ class QuantityAlertsWidget(QGroupBox):
         """
         thresholds = {}
         
-        for row in range(self.table.rowCount()):
-            # Get user alias
-            alias_item = self.table.item(row, 0)
-            if not alias_item:
-                continue
-            # Read from UserRole so it works even when text is masked as *****
-            user_alias = alias_item.data(32) or alias_item.text()
-            
-            # Get threshold values
-            calls_sell = self.table.cellWidget(row, 1)
-            puts_sell = self.table.cellWidget(row, 2)
-            calls_buy = self.table.cellWidget(row, 3)
-            puts_buy = self.table.cellWidget(row, 4)
-            calls_net = self.table.cellWidget(row, 5)
-            puts_net = self.table.cellWidget(row, 6)
-            
+        # Aliases come from the model, so this works even when masked as *****
+        for row, user_alias in enumerate(self.model.aliases()):
             thresholds[user_alias] = {
-                'calls_sell': calls_sell.text() if calls_sell else '',
-                'puts_sell': puts_sell.text() if puts_sell else '',
-                'calls_buy': calls_buy.text() if calls_buy else '',
-                'puts_buy': puts_buy.text() if puts_buy else '',
-                'calls_net': calls_net.text() if calls_net else '',
-                'puts_net': puts_net.text() if puts_net else ''
+                key: self.model.value(row, col)
+                for col, key in enumerate(self.THRESHOLD_KEYS, 1)
             }
         
         return thresholds
@@ -256,37 +187,28 @@ class QuantityAlertsWidget(QGroupBox):
             user_alias: User alias string
             thresholds: Dict with keys: calls_sell, puts_sell, calls_buy, puts_buy, calls_net, puts_net
         """
-        # Find row for this user
-        for row in range(self.table.rowCount()):
-            alias_item = self.table.item(row, 0)
-            if alias_item and alias_item.text() == user_alias:
-                # Set values
-                widgets = [
-                    self.table.cellWidget(row, 1),  # calls_sell
-                    self.table.cellWidget(row, 2),  # puts_sell
-                    self.table.cellWidget(row, 3),  # calls_buy
-                    self.table.cellWidget(row, 4),  # puts_buy
-                    self.table.cellWidget(row, 5),  # calls_net
-                    self.table.cellWidget(row, 6),  # puts_net
-                ]
-                keys = ['calls_sell', 'puts_sell', 'calls_buy', 'puts_buy', 'calls_net', 'puts_net']
-                
-                # Block signals on all widgets
-                for widget in widgets:
-                    if widget:
-                        widget.blockSignals(True)
-                
-                # Set values
-                for widget, key in zip(widgets, keys):
-                    if widget:
-                        widget.setText(str(thresholds.get(key, '')))
-                
-                # Unblock signals
-                for widget in widgets:
-                    if widget:
-                        widget.blockSignals(False)
-                
-                break
+        row = self.model.row_of(user_alias)
+        if row < 0:
+            return
+        
+        # set_value does not emit value_edited, so no config_changed here
+        for col, key in enumerate(self.THRESHOLD_KEYS, 1):
+            self.model.set_value(row, col, str(thresholds.get(key, '')))
+    
+    def set_user_thresholds_bulk(self, mapping):
+        """
+        Set thresholds for many users with a single model update
+        
+        Args:
+            mapping: Dict: {user_alias: {calls_sell, puts_sell, calls_buy, puts_buy, calls_net, puts_net}}
+        """
+        self.model.set_values_bulk({
+            user_alias: {
+                col: str(thresholds.get(key, ''))
+                for col, key in enumerate(self.THRESHOLD_KEYS, 1)
+            }
+            for user_alias, thresholds in mapping.items()
+        })
     
     def is_enabled(self):
         """Check if quantity alerts are enabled"""
@@ -0,0 +1,95 @@
+"""
+Threshold Delegate
+Item delegate for editing per-user alert thresholds in place
+"""
+from PyQt6.QtWidgets import (QApplication, QStyledItemDelegate, QStyleOptionViewItem,
+                             QLineEdit, QStyle)
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QColor, QDoubleValidator, QFont, QIntValidator, QPen
+
+
+class ThresholdDelegate(QStyledItemDelegate):
+    """
+    Draws threshold cells as input boxes and edits them with a QLineEdit
+    
+    Only the cell being edited has a live QLineEdit; every other cell is
+    painted to look like one.
+    """
+    
+    # Painted to match the editor, which is styled by the table's stylesheet
+    BOX_BACKGROUND = QColor("#1a1f2e")
+    BOX_BORDER = QColor("#4a5568")
+    BOX_TEXT = QColor("#e2e8f0")
+    BOX_RADIUS = 3
+    BOX_MARGIN_X = 6
+    BOX_MARGIN_Y = 5
+    FONT_PIXEL_SIZE = 11
+    
+    def __init__(self, bottom=None, top=None, decimals=None, parent=None):
+        """
+        Args:
+            bottom: Lowest accepted value, or None for no limit
+            top: Highest accepted value, or None for no limit
+            decimals: Maximum decimals, 0 for whole numbers only, or None
+                for the validator default
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        if decimals == 0:
+            self._validator = QIntValidator(self)
+        else:
+            self._validator = QDoubleValidator(self)
+            self._validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+            if decimals is not None:
+                self._validator.setDecimals(decimals)
+        if bottom is not None:
+            self._validator.setBottom(bottom)
+        if top is not None:
+            self._validator.setTop(top)
+    
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        editor.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        editor.setValidator(self._validator)
+        return editor
+    
+    def setEditorData(self, editor, index):
+        editor.setText(index.data(Qt.ItemDataRole.EditRole) or '')
+    
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.text(), Qt.ItemDataRole.EditRole)
+    
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect.adjusted(
+            self.BOX_MARGIN_X, self.BOX_MARGIN_Y, -self.BOX_MARGIN_X, -self.BOX_MARGIN_Y
+        ))
+    
+    def paint(self, painter, option, index):
+        # Item background first (hover, selection and focus), as the other
+        # columns get it; the box is drawn on top
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget)
+        
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        
+        # Input box inset in the cell, as the QLineEdit was
+        box = QRectF(option.rect).adjusted(
+            self.BOX_MARGIN_X + 0.5, self.BOX_MARGIN_Y + 0.5,
+            -self.BOX_MARGIN_X - 0.5, -self.BOX_MARGIN_Y - 0.5
+        )
+        painter.setPen(QPen(self.BOX_BORDER, 1))
+        painter.setBrush(self.BOX_BACKGROUND)
+        painter.drawRoundedRect(box, self.BOX_RADIUS, self.BOX_RADIUS)
+        
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        if text:
+            font = QFont(option.font)
+            font.setPixelSize(self.FONT_PIXEL_SIZE)
+            painter.setFont(font)
+            painter.setPen(self.BOX_TEXT)
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, text)
+        
+        painter.restore()
@@ -0,0 +1,242 @@
+"""
+User Alias Model
+Table model backing the per-user alert threshold tables
+"""
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+
+class UserAliasModel(QAbstractTableModel):
+    """
+    Model holding one row per user alias
+    
+    Column 0 shows the alias (or ***** when masked). The remaining
+    columns hold one threshold text per user, edited in place through
+    an item delegate.
+    """
+    
+    # Emitted when the user commits an edit (not for set_value)
+    value_edited = pyqtSignal()
+    
+    MASK_TEXT = "*****"
+    
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._aliases = []
+        self._rows = {}  # {user_alias: row}
+        self._values = {}  # {user_alias: [text per threshold column]}
+        self._masked = False
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._aliases)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if index.column() != 0:
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+                return self._values[self._aliases[index.row()]][index.column() - 1]
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if self._masked:
+                return self.MASK_TEXT
+            return self._aliases[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._aliases[index.row()]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(self._headers)):
+            return self._headers[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() != 0:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsEditable
+        return Qt.ItemFlag.ItemIsEnabled
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if (not index.isValid() or index.column() == 0
+                or role != Qt.ItemDataRole.EditRole):
+            return False
+        if self.set_value(index.row(), index.column(), value):
+            self.value_edited.emit()
+        return True
+    
+    def set_aliases(self, user_aliases):
+        """
+        Update the rows to a new list of user aliases
+        
+        Rows are removed, moved and inserted in place instead of resetting
+        the model, so an open editor and the current index survive a user
+        list change. Threshold values are kept for aliases that are still
+        present; new aliases start with empty values.
+        
+        Args:
+            user_aliases: List of user alias strings
+        """
+        new_aliases = list(user_aliases)
+        if new_aliases == self._aliases:
+            return
+        
+        empty = [''] * (len(self._headers) - 1)
+        new_set = set(new_aliases)
+        if len(new_set) != len(new_aliases):
+            # Duplicate aliases cannot be matched to rows one-to-one
+            self.beginResetModel()
+            self._aliases = new_aliases
+            self._values = {alias: self._values.get(alias) or list(empty) for alias in new_aliases}
+            self._rows = {alias: row for row, alias in enumerate(self._aliases)}
+            self.endResetModel()
+            return
+        
+        # Remove rows of aliases that are gone, one contiguous run at a time
+        row = len(self._aliases)
+        while row > 0:
+            row -= 1
+            if self._aliases[row] in new_set:
+                continue
+            last = row
+            while row > 0 and self._aliases[row - 1] not in new_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            for alias in self._aliases[row:last + 1]:
+                del self._values[alias]
+            del self._aliases[row:last + 1]
+            self.endRemoveRows()
+        
+        # Move the remaining rows into the new order
+        kept = [alias for alias in new_aliases if alias in self._values]
+        if kept != self._aliases:
+            self.layoutAboutToBeChanged.emit()
+            old_aliases = self._aliases
+            self._aliases = kept
+            new_rows = {alias: row for row, alias in enumerate(kept)}
+            old_indexes = self.persistentIndexList()
+            self.changePersistentIndexList(old_indexes, [
+                self.index(new_rows[old_aliases[index.row()]], index.column())
+                for index in old_indexes
+            ])
+            self.layoutChanged.emit()
+        
+        # Insert the new aliases, one contiguous run at a time
+        row = 0
+        while row < len(new_aliases):
+            if row < len(self._aliases) and self._aliases[row] == new_aliases[row]:
+                row += 1
+                continue
+            end = row
+            while end < len(new_aliases) and new_aliases[end] not in self._values:
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            for alias in new_aliases[row:end]:
+                self._values[alias] = list(empty)
+            self._aliases[row:row] = new_aliases[row:end]
+            self.endInsertRows()
+            row = end
+        
+        self._rows = {alias: row for row, alias in enumerate(self._aliases)}
+    
+    def aliases(self):
+        """Get the real user aliases in row order"""
+        return list(self._aliases)
+    
+    def value(self, row, col):
+        """Get the threshold text at (row, col); col is 1-based"""
+        return self._values[self._aliases[row]][col - 1]
+    
+    def set_value(self, row, col, text):
+        """
+        Set the threshold text at (row, col) without emitting value_edited
+        
+        Returns:
+            True if the stored text changed
+        """
+        text = '' if text is None else str(text)
+        values = self._values[self._aliases[row]]
+        if values[col - 1] == text:
+            return False
+        values[col - 1] = text
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        return True
+    
+    def set_values_bulk(self, mapping):
+        """
+        Set threshold texts for many users with a single dataChanged
+        
+        Like set_value, this does not emit value_edited. Aliases that are
+        not in the model are ignored.
+        
+        Args:
+            mapping: Dict: {user_alias: {col: text}}; col is 1-based
+        
+        Returns:
+            True if any stored text changed
+        """
+        first_col = len(self._headers)
+        last_col = 0
+        for user_alias, texts in mapping.items():
+            values = self._values.get(user_alias)
+            if values is None:
+                continue
+            for col, text in texts.items():
+                text = '' if text is None else str(text)
+                if values[col - 1] != text:
+                    values[col - 1] = text
+                    first_col = min(first_col, col)
+                    last_col = max(last_col, col)
+        
+        if last_col == 0:
+            return False
+        self.dataChanged.emit(
+            self.index(0, first_col),
+            self.index(len(self._aliases) - 1, last_col),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole]
+        )
+        return True
+    
+    def row_of(self, user_alias):
+        """
+        Get the row for a user alias
+        
+        Returns:
+            Row index, or -1 if the alias is not in the model
+        """
+        return self._rows.get(user_alias, -1)
+    
+    def set_masked(self, masked):
+        """
+        Mask or restore the alias column
+        
+        Args:
+            masked: True to display ***** instead of the aliases
+        """
+        masked = bool(masked)
+        if masked == self._masked:
+            return
+        self._masked = masked
+        
+        if self._aliases:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._aliases) - 1, 0),
+                [Qt.ItemDataRole.DisplayRole]
+            )
+    
+    def is_masked(self):
+        """Check if the alias column is masked"""
+        return self._masked
@@ -4,6 +4,12 @@ Number, currency, and text formatting
 """
 
 
+# Sign colors shared by P&L and quantities
+COLOR_POSITIVE = "#48bb78"  # Green
+COLOR_NEGATIVE = "#f56565"  # Red
+COLOR_NEUTRAL = "#a0aec0"   # Gray
+
+
 def format_currency(value, symbol="Rs."):
     """
     Format number as currency
@@ -144,11 +150,11 @@ def get_pnl_color(value):
         Color hex code
     """
     if value > 0:
-        return "#48bb78"  # Green
+        return COLOR_POSITIVE
     elif value < 0:
-        return "#f56565"  # Red
+        return COLOR_NEGATIVE
     else:
-        return "#a0aec0"  # Gray
+        return COLOR_NEUTRAL
 
 
 def get_quantity_color(value):
@@ -162,11 +168,11 @@ def get_quantity_color(value):
         Color hex code
     """
     if value > 0:
-        return "#48bb78"  # Green (buy)
+        return COLOR_POSITIVE  # Buy
     elif value < 0:
-        return "#f56565"  # Red (sell)
+        return COLOR_NEGATIVE  # Sell
     else:
-        return "#a0aec0"  # Gray (neutral)
+        return COLOR_NEUTRAL
 
 
 def truncate_text(text, max_length=20):